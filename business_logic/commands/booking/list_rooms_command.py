@@ -64,7 +64,7 @@ from mysql.connector.cursor_cext import CMySQLCursor
 
 from business_logic.base.command import Command
 from business_logic.room_database_manager import db
-from presentation.table_formatter import format_booking_table
+from presentation.table_formatter import format_booking_table, write_table
 
 
 class ListRoomCommand(Command):
@@ -322,11 +322,11 @@ class ListRoomCommand(Command):
         """
         bookings = db.show_bookings()
 
-        # Format and print the table
+        # Format the table and write it with a single stdout write
         formatted_table = format_booking_table(bookings)
-        print(formatted_table)
+        write_table(formatted_table)
 
-        # Return None as result since we already printed the formatted table
+        # Return None as result since we already wrote the formatted table
         return True, None
 
 
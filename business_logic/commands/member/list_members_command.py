@@ -72,7 +72,7 @@ from mysql.connector.cursor_cext import CMySQLCursor
 
 from business_logic.base.command import Command
 from business_logic.member_database_manager import db
-from presentation.table_formatter import format_member_table
+from presentation.table_formatter import format_member_table, write_table
 
 
 class ListMembersCommand(Command):
@@ -483,9 +483,9 @@ class ListMembersCommand(Command):
         """
         members = db.show_members()  # This already returns a list, not a cursor
 
-        # Format and print the table
+        # Format the table and write it with a single stdout write
         formatted_table = format_member_table(members)
-        print(formatted_table)
+        write_table(formatted_table)
 
-        # Return None as result since we already printed the formatted table
+        # Return None as result since we already wrote the formatted table
         return True, None
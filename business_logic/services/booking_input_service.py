@@ -71,7 +71,14 @@ Security Considerations:
 from datetime import datetime, date, time
 from typing import Optional, Tuple
 
-from persistence.models import Booking, SearchRoom
+from persistence.models import (
+    ENABLE_PYDANTIC_VALIDATION,
+    Booking,
+    BookingDict,
+    SearchRoom,
+    booking_from_payload_fast,
+    make_booking_trusted,
+)
 from presentation.user_input import get_user_input
 from presentation.utils import clear_screen
 
@@ -303,10 +310,18 @@ class BookingInputService:
             if user is None:
                 return None
 
-            # Create and validate booking object
-            booking = Booking(
-                room_id=room_id, book_date=book_date, book_time=book_time, user=user
-            )
+            # Create and validate booking object. The collectors above already
+            # return typed values, so the pydantic pass can be switched off.
+            payload: BookingDict = {
+                "room_id": room_id,
+                "book_date": book_date,
+                "book_time": book_time,
+                "user": user,
+            }
+            if ENABLE_PYDANTIC_VALIDATION:
+                booking = Booking(**payload)
+            else:
+                booking = make_booking_trusted(booking_from_payload_fast(payload))
 
             # Display booking summary for confirmation
             print("\n" + "=" * 50)
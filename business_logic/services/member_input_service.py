@@ -57,6 +57,24 @@ from presentation.user_input import get_user_input
 from typing import Optional, Tuple
 
 
+def _is_valid_email(email: str) -> bool:
+    """
+    Perform the basic email format check used when collecting member input.
+
+    The check is intentionally cheap (an "@" and a "." must be present) and runs
+    only where an address is entered - account creation and email updates - so
+    the Member model itself can keep a plain str field without an email
+    validator running on every construction.
+
+    Args:
+        email (str): The email address entered by the user.
+
+    Returns:
+        bool: True if the address passes the basic format check.
+    """
+    return "@" in email and "." in email
+
+
 class MemberInputService:
     """
     Centralized service for collecting and validating member-related input data.
@@ -184,6 +202,10 @@ class MemberInputService:
             password = get_user_input("Enter password", required=True)
             email = get_user_input("Enter email", required=True)
 
+            if not _is_valid_email(email):
+                print("❌ Invalid email format")
+                return None
+
             # Create and validate Member object using Pydantic
             member = Member(id=member_id, password=password, email=email)
             return member
@@ -263,8 +285,7 @@ class MemberInputService:
             member_id = get_user_input("Enter member username", required=True)
             new_email = get_user_input("Enter new email address", required=True)
 
-            # Basic email validation (you could enhance this with regex)
-            if "@" not in new_email or "." not in new_email:
+            if not _is_valid_email(new_email):
                 print("❌ Invalid email format")
                 return None
 
@@ -25,11 +25,12 @@
 -- 	delete_member
 -- 	update_member_password (ENHANCED - with validation)
 -- 	update_member_email (ENHANCED - with validation)
+-- 	update_member (password and/or email in one call)
 -- 	make_booking (ENHANCED - with better error handling)
 -- 	update_payment
 -- 	view_bookings
 -- 	search_room
--- 	cancel_booking (ENHANCED - with security and better validation)
+-- 	cancel_booking (ENHANCED - with security and better validation, numeric status)
 
 -- Trigger
 -- 	payment_check
@@ -173,7 +174,13 @@ CREATE TABLE bookings (
     INDEX idx_room_booking (room_id, booked_date),
     INDEX idx_booking_status (payment_status),
     INDEX idx_booking_date (booked_date),
-    INDEX idx_datetime_booking (datetime_of_booking)
+    INDEX idx_datetime_booking (datetime_of_booking),
+    -- Covering index for the availability filter in search_room (booked slot ->
+    -- room ids): equality on date and time, then status, with room_id read
+    -- from the index so the subquery never touches the table rows. The
+    -- make_booking conflict check is already served by uc_room_datetime.
+    -- member_bookings is a view, so indexes live on this base table.
+    INDEX idx_booking_slot (booked_date, booked_time, payment_status, room_id)
 );
 
 insert into bookings (
@@ -363,6 +370,78 @@ CREATE VIEW member_bookings AS
     ORDER BY bookings.id;
 
 
+-- Materialized booking listing for RoomBookingDatabase.show_bookings().
+-- The member_bookings view joins bookings to rooms on every read; this table
+-- keeps the listing columns pre-joined, one row per booking keyed by the
+-- booking id, so the admin listing (and its keyset-paginated form) is a plain
+-- primary key scan. The triggers below keep it in step with bookings and
+-- with room type changes.
+CREATE TABLE booking_summary (
+    booking_id INT NOT NULL,
+    room_id VARCHAR(10) NOT NULL,
+    room_type VARCHAR(50) NOT NULL,
+    datetime_of_booking TIMESTAMP NOT NULL,
+    member_id VARCHAR(50) NOT NULL,
+    payment_status ENUM('UNPAID', 'PAID', 'CANCELLED', 'REFUNDED') NOT NULL,
+
+    PRIMARY KEY (booking_id),
+    INDEX idx_summary_room (room_id)
+);
+
+insert into booking_summary (
+	booking_id, room_id, room_type, datetime_of_booking, member_id, payment_status)
+select b.id, b.room_id, r.room_type, b.datetime_of_booking, b.member_id, b.payment_status
+from bookings b
+join rooms r on b.room_id = r.id;
+
+delimiter $$
+create trigger trg_booking_summary_insert
+	after insert on bookings
+	for each row
+begin
+	insert into booking_summary (
+		booking_id, room_id, room_type, datetime_of_booking, member_id, payment_status)
+	select NEW.id, NEW.room_id, r.room_type, NEW.datetime_of_booking, NEW.member_id, NEW.payment_status
+	from rooms r
+	where r.id = NEW.room_id;
+end$$
+
+create trigger trg_booking_summary_update
+	after update on bookings
+	for each row
+begin
+	update booking_summary s
+	join rooms r on r.id = NEW.room_id
+	set
+		s.booking_id = NEW.id,
+		s.room_id = NEW.room_id,
+		s.room_type = r.room_type,
+		s.datetime_of_booking = NEW.datetime_of_booking,
+		s.member_id = NEW.member_id,
+		s.payment_status = NEW.payment_status
+	where s.booking_id = OLD.id;
+end$$
+
+create trigger trg_booking_summary_delete
+	after delete on bookings
+	for each row
+begin
+	delete from booking_summary where booking_id = OLD.id;
+end$$
+
+create trigger trg_booking_summary_room_type
+	after update on rooms
+	for each row
+begin
+	if NEW.room_type != OLD.room_type or NEW.id != OLD.id then
+		update booking_summary
+		set room_id = NEW.id, room_type = NEW.room_type
+		where room_id = OLD.id;
+	end if;
+end$$
+delimiter ;
+
+
 -- Stored Procedures
 -- Insert New Member Procedure
 delimiter $$
@@ -434,7 +513,31 @@ delimiter ;
 
 call update_member_email('nethead21', 'helloworld@gmail.com');
 
+-- Update Member Procedure (password and/or email in a single row update)
+-- Pass NULL for any field that should keep its current value.
+delimiter $$
+create procedure update_member(in p_id varchar(255), in p_passwords varchar(255), in p_email varchar(255))
+	begin
+		declare v_count int default 0;
+		select count(*) into v_count from members where id = p_id;
+		if v_count = 0 then
+			signal sqlstate '45000' set message_text = 'Member not found';
+		else
+			update members
+			set password = coalesce(p_passwords, password),
+				email = coalesce(p_email, email)
+			where id = p_id;
+		end if;
+	end $$
+
+delimiter ;
+
+call update_member('nethead21', 'hello_world', 'helloworld@gmail.com');
+
 -- ENHANCED: Making Booking Procedure with comprehensive validation
+-- Besides the OUT parameters, the procedure ends with a one-row result set
+-- (booking_id, status, message), so clients can read the outcome from the
+-- CALL itself without a second SELECT of the session variables.
 delimiter $$
 create procedure make_booking(
 	in p_room_id varchar(255), 
@@ -459,6 +562,7 @@ create procedure make_booking(
 			set p_booking_id = null;
 			set p_status = 'ERROR';
 			set p_message = 'Database error occurred during booking creation';
+			select p_booking_id as booking_id, p_status as status, p_message as message;
 		end;
 		
 		start transaction;
@@ -485,7 +589,10 @@ create procedure make_booking(
 				set p_message = 'Member not found or inactive';
 				rollback;
 			else
-				-- Check for booking conflicts
+				-- Check for booking conflicts. The slot is stored as separate
+				-- booked_date/booked_time columns and compared as-is (no function
+				-- wrapped around either side), so this is a sargable equality lookup
+				-- on the uc_room_datetime unique key.
 				select count(*) into v_conflict_count
 				from bookings 
 				where room_id = p_room_id 
@@ -546,6 +653,8 @@ create procedure make_booking(
 				end if;
 			end if;
 		end if;
+
+		select p_booking_id as booking_id, p_status as status, p_message as message;
 	end $$
 delimiter ;
 
@@ -678,6 +787,9 @@ call view_bookings('macejkovic73', @status, @message);
 select @status as status, @message as message;
 
 -- ENHANCED: Making Search Rooms Procedure with comprehensive filtering
+-- Like make_booking, the procedure ends with a one-row (status, message)
+-- result set after the room rows (if any), so clients read the outcome from
+-- the CALL itself without a second SELECT of the session variables.
 delimiter $$
 create procedure search_room(
 	in p_room_type varchar(255),
@@ -693,6 +805,7 @@ create procedure search_room(
 		begin
 			set p_status = 'ERROR';
 			set p_message = 'Database error occurred during room search';
+			select p_status as status, p_message as message;
 		end;
 		
 		-- Validate search date is not in the past
@@ -756,6 +869,8 @@ create procedure search_room(
 				set p_message = concat(v_search_count, ' room(s) found for ', p_room_type);
 			end if;
 		end if;
+
+		select p_status as status, p_message as message;
 	end $$
 delimiter ;
 
@@ -847,9 +962,14 @@ delimiter ;
 -- call get_booking_audit_trail(5, '2025-08-01', '2025-08-31', @status, @message);
 
 -- Making Cancel Booking
+-- p_status: 0 = cancelled, 1 = on/after the booked date,
+--           2 = already cancelled or paid, 3 = booking not found
+-- The procedure also ends with a one-row (status, message) result set, so
+-- clients read the outcome from the CALL without a SELECT of the variables.
 delimiter $$
 create procedure cancel_booking(
 	in p_booking_id int,
+	out p_status tinyint,
 	out p_message varchar(255)
 	)
 	begin
@@ -872,9 +992,14 @@ create procedure cancel_booking(
 		select payment_due into v_payment_due 
 		from members where id = v_member_id;
 
-		if curdate() >= v_booked_date then
+		if v_member_id is null then
+			set p_status = 3;
+			select 'Booking not found' into p_message;
+		elseif curdate() >= v_booked_date then
+			set p_status = 1;
 			select 'Cancellation cannot be done on/after the booked date' into p_message;
 		elseif v_payment_status = 'CANCELLED' or v_payment_status = 'PAID' then
+			set p_status = 2;
 			select 'Booking has already been cancelled or paid' into p_message;
 		else
 			update bookings set payment_status = 'CANCELLED' where id = p_booking_id;
@@ -887,10 +1012,12 @@ create procedure cancel_booking(
 
 			update members set payment_due = v_payment_due where id = v_member_id;
 
+			set p_status = 0;
 			select 'Booking Cancelled' into p_message;
 
 		end if;
 
+		select p_status as status, p_message as message;
 	end $$
 delimiter ;
 
@@ -1,3 +1,11 @@
+import logging
+
 from presentation.menu import main_menu
 
-main_menu()
+if __name__ == "__main__":
+    # Repository status messages go through logging; show them on the console
+    # as plain lines, like the CLI's own output. Configured only when run as
+    # the application, so importing this module leaves logging untouched.
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    main_menu()
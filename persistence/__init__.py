@@ -1,3 +1,3 @@
-from .database import DatabaseManager
+from .database import DatabaseManager, db_operation, get_db
 from .member_booking_database import MemberBookingDatabase
 from .room_booking_database import RoomBookingDatabase
@@ -0,0 +1,167 @@
+"""
+In-memory room availability index for the Sports Booking Management System.
+
+This module provides the AvailabilityIndex class, a compact in-process view of
+which rooms are booked at which start times. RoomBookingDatabase uses it as a
+negative pre-check for room searches: when the index shows that every room of
+the requested type is already booked for the requested slot, the search is
+answered without calling the search_room stored procedure.
+
+Representation:
+    Each (room_id, date) pair maps to one Python int used as a bitmap with one
+    bit per minute of the day (bit hour * 60 + minute). Bookings start at an
+    HH:MM time and conflict only on an exact start-time match, so minute
+    resolution mirrors the make_booking conflict rule exactly. Checking a slot
+    for every room of a type is then a handful of bit tests instead of a join
+    over the bookings table.
+
+Consistency:
+    The index is only an optimisation and never the final answer. A "no room
+    is free" result nominates the slot as fully booked; RoomBookingDatabase
+    confirms it with a query against the live tables before skipping the
+    stored procedure, because cancellations or room changes made elsewhere
+    are only picked up when the index is rebuilt. Bookings made by other
+    processes only make the index look emptier than reality, which falls
+    through to the stored procedure.
+
+Room types are matched case-insensitively (str.casefold), like the
+RoomBookingDatabase search cache and MySQL's default collation.
+
+Classes:
+    AvailabilityIndex: Per-room, per-day booked-slot bitmaps.
+
+Example:
+    >>> index = AvailabilityIndex()
+    >>> index.load(
+    ...     rooms=[("T1", "Tennis Court"), ("T2", "Tennis Court")],
+    ...     bookings=[("T1", date(2025, 8, 25), time(14, 30))],
+    ... )
+    >>> index.has_free_room("Tennis Court", date(2025, 8, 25), time(14, 30))
+    True
+    >>> index.mark_booked("T2", date(2025, 8, 25), time(14, 30))
+    >>> index.has_free_room("Tennis Court", date(2025, 8, 25), time(14, 30))
+    False
+"""
+
+import threading
+from datetime import date, time, timedelta
+from time import monotonic
+from typing import Iterable, Optional, Union
+
+
+def _minute_of_day(start: Union[time, timedelta]) -> int:
+    """
+    Return the bit position for a booking start time.
+
+    MySQL TIME columns are returned by the connector as timedelta, while
+    application code passes datetime.time, so both are accepted.
+    """
+    if isinstance(start, timedelta):
+        return int(start.total_seconds()) // 60
+    return start.hour * 60 + start.minute
+
+
+class AvailabilityIndex:
+    """
+    In-memory bitmaps of booked start times per room and day.
+
+    The index holds the bookable rooms grouped by room type and, for every
+    room and date with at least one active booking, an int bitmap of booked
+    start minutes. All methods are safe to call from several threads.
+
+    Attributes:
+        loaded_at (float | None): monotonic() timestamp of the last load(),
+            or None if the index has never been loaded or was invalidated.
+
+    Example:
+        >>> index = AvailabilityIndex()
+        >>> index.load(rooms=[("AR", "Archery Range")], bookings=[])
+        >>> index.has_free_room("Archery Range", date(2025, 8, 25), time(9, 0))
+        True
+    """
+
+    def __init__(self):
+        """Create an empty, not yet loaded index."""
+        self._lock = threading.Lock()
+        self._rooms_by_type: dict[str, tuple[str, ...]] = {}
+        self._booked: dict[tuple[str, int], int] = {}
+        self.loaded_at: Optional[float] = None
+
+    def load(
+        self,
+        rooms: Iterable[tuple[str, str]],
+        bookings: Iterable[tuple[str, date, Union[time, timedelta]]],
+    ) -> None:
+        """
+        Replace the index contents with a fresh snapshot.
+
+        Args:
+            rooms: (room_id, room_type) pairs of every bookable room.
+            bookings: (room_id, booked_date, booked_time) of every active
+                (not cancelled) booking to index.
+        """
+        rooms_by_type: dict[str, list[str]] = {}
+        for room_id, room_type in rooms:
+            rooms_by_type.setdefault(room_type.casefold(), []).append(room_id)
+
+        booked: dict[tuple[str, int], int] = {}
+        for room_id, booked_date, booked_time in bookings:
+            key = (room_id, booked_date.toordinal())
+            booked[key] = booked.get(key, 0) | (1 << _minute_of_day(booked_time))
+
+        with self._lock:
+            self._rooms_by_type = {
+                room_type: tuple(room_ids)
+                for room_type, room_ids in rooms_by_type.items()
+            }
+            self._booked = booked
+            self.loaded_at = monotonic()
+
+    def is_stale(self, max_age: float) -> bool:
+        """Return True if the index is unloaded or older than max_age seconds."""
+        loaded_at = self.loaded_at
+        return loaded_at is None or monotonic() - loaded_at > max_age
+
+    def invalidate(self) -> None:
+        """Mark the index stale so the owner rebuilds it before the next use."""
+        with self._lock:
+            self.loaded_at = None
+
+    def mark_booked(
+        self, room_id: str, book_date: date, book_time: Union[time, timedelta]
+    ) -> None:
+        """Record a new booking of room_id at book_date/book_time."""
+        key = (room_id, book_date.toordinal())
+        with self._lock:
+            self._booked[key] = self._booked.get(key, 0) | (
+                1 << _minute_of_day(book_time)
+            )
+
+    def has_free_room(
+        self, room_type: str, book_date: date, book_time: Union[time, timedelta]
+    ) -> bool:
+        """
+        Check whether any room of room_type is free at book_date/book_time.
+
+        A room type the index does not know is reported as free, so the
+        caller falls back to the database. room_type is compared
+        case-insensitively.
+
+        Args:
+            room_type (str): Facility type, e.g. "Tennis Court".
+            book_date (date): Requested booking date.
+            book_time (time | timedelta): Requested start time.
+
+        Returns:
+            bool: False only if every known room of the type is booked.
+        """
+        bit = 1 << _minute_of_day(book_time)
+        ordinal = book_date.toordinal()
+        with self._lock:
+            room_ids = self._rooms_by_type.get(room_type.casefold())
+            if not room_ids:
+                return True
+            booked = self._booked
+            return any(
+                not booked.get((room_id, ordinal), 0) & bit for room_id in room_ids
+            )
@@ -13,11 +13,18 @@ foundation for all data persistence operations in the system.
 Classes:
     DatabaseManager: Core database connection and query execution manager.
 
+Functions:
+    get_db: Return the process-wide shared DatabaseManager.
+    db_operation: Decorator that retries deadlocks and turns database errors
+        into a default result for repository methods.
+
 Dependencies:
     - os: Environment variable access for configuration
     - mysql.connector: MySQL database connectivity
     - dotenv: Environment variable loading from .env files
     - mysql.connector.cursor: Database cursor type annotations
+    - mysql.connector.pooling: Shared connection pool (see get_conn)
+    - contextlib.contextmanager: Pooled connection checkout/return
 
 Configuration:
     Requires environment variables:
@@ -44,14 +51,49 @@ Security Note:
     Ensure .env file is properly secured and not committed to version control.
 """
 
+import copy
+import functools
+import logging
 import os
+import time
+from contextlib import contextmanager
 
 import mysql.connector
+import mysql.connector.pooling
 from dotenv import load_dotenv
-from mysql.connector import cursor
+from mysql.connector import cursor, errorcode
+from mysql.connector.constants import ClientFlag
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Attempts made by db_operation() when InnoDB picks the call as a deadlock
+# victim, and the first backoff delay in seconds (doubled per retry).
+DEADLOCK_RETRIES = 3
+DEADLOCK_BACKOFF = 0.01
+
+
+def _connection_config() -> dict:
+    """Return the mysql.connector keyword arguments shared by every connection."""
+    return {
+        "host": "localhost",
+        "user": "root",
+        "passwd": os.getenv("PASSWORD"),
+        "database": "sports_booking",
+        # The booking repository sends a CALL and the SELECT of its OUT
+        # variables (or several CALLs) as one multi-statement request, so
+        # request both flags explicitly instead of relying on the
+        # connector's defaults.
+        "client_flags": [ClientFlag.MULTI_STATEMENTS, ClientFlag.MULTI_RESULTS],
+    }
+
+# Values accepted by DatabaseManager.get_conn(isolation_level=...). The level
+# is interpolated into SQL, so only these literal spellings are allowed.
+ISOLATION_LEVELS = frozenset(
+    {"READ UNCOMMITTED", "READ COMMITTED", "REPEATABLE READ", "SERIALIZABLE"}
+)
+
 
 class DatabaseManager:
     """
@@ -69,6 +111,14 @@ class DatabaseManager:
     Attributes:
         connection (mysql.connector.MySQLConnection): Active database connection.
         cursor (mysql.connector.cursor.MySQLCursor): Default cursor for the connection.
+        _prepared (dict[str, MySQLCursorPrepared]): Prepared cursor per
+            statement text, used by fetch_all().
+        data_version (int): Class-level counter shared by every instance and
+            bumped by mark_data_changed() after each committed write. Read
+            caches key on it so they are invalidated by writes made through
+            any repository in this process.
+        POOL_NAME (str): Name of the shared connection pool.
+        POOL_SIZE (int): Number of connections kept in the shared pool.
 
     Connection Parameters:
         - Host: localhost (local MySQL server)
@@ -112,7 +162,16 @@ class DatabaseManager:
         environment variable must be set in the .env file.
     """
 
-    def __init__(self):
+    data_version: int = 0
+
+    POOL_NAME = "sports_booking"
+    # Connections are only held for one procedure call, so a pool roughly the
+    # size of the number of concurrently booking threads is enough. Override
+    # with DB_POOL_SIZE for servers that run more worker threads.
+    POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "16"))
+    _pool = None
+
+    def __init__(self, **connection_options):
         """
         Initialize a new DatabaseManager instance with MySQL connection.
 
@@ -126,6 +185,11 @@ class DatabaseManager:
         2. Establishes MySQL connection with configured parameters
         3. Creates a default cursor for immediate use
 
+        Args:
+            **connection_options: Extra mysql.connector.connect() keyword
+                arguments for this connection only, e.g.
+                allow_local_infile_in_path for LOAD DATA LOCAL INFILE imports.
+
         Environment Variables Required:
             PASSWORD (str): MySQL database password for the root user
 
@@ -158,12 +222,10 @@ class DatabaseManager:
             applications to prevent connection pool exhaustion.
         """
         self.connection = mysql.connector.connect(
-            host="localhost",
-            user="root",
-            passwd=os.getenv("PASSWORD"),
-            database="sports_booking",
+            **_connection_config(), **connection_options
         )
         self.cursor = self.connection.cursor()
+        self._prepared: dict[str, cursor.MySQLCursorPrepared] = {}
 
     def __del__(self):
         """
@@ -209,8 +271,129 @@ class DatabaseManager:
             so critical cleanup should not rely solely on this method.
             Consider implementing a close() method for explicit cleanup.
         """
+        for prepared_cursor in self._prepared.values():
+            prepared_cursor.close()
         self.connection.close()
 
+    @classmethod
+    def _get_pool(cls) -> mysql.connector.pooling.MySQLConnectionPool:
+        """
+        Return the process-wide connection pool, creating it on first use.
+
+        The pool is created lazily so importing the persistence package does
+        not open any connection.
+        """
+        if cls._pool is None:
+            cls._pool = mysql.connector.pooling.MySQLConnectionPool(
+                pool_name=cls.POOL_NAME,
+                pool_size=cls.POOL_SIZE,
+                # Clear session variables and temporary tables on return, so
+                # no borrower sees state left behind by the previous one
+                pool_reset_session=True,
+                **_connection_config(),
+            )
+        return cls._pool
+
+    @classmethod
+    @contextmanager
+    def get_conn(cls, isolation_level: str | None = None):
+        """
+        Check a connection out of the shared pool for the duration of a block.
+
+        Unlike a DatabaseManager instance, which holds one dedicated connection
+        for its whole lifetime, this borrows a pooled connection per operation.
+        Concurrent callers therefore do not share (and serialize on) a single
+        connection, and the TCP/authentication handshake is paid once per
+        pooled connection rather than once per repository instance.
+
+        If the block raises, the open transaction is rolled back. The
+        connection is always returned to the pool on exit; the block must
+        commit explicitly to keep its changes.
+
+        Args:
+            isolation_level (str, optional): Transaction isolation level for
+                this checkout, one of ISOLATION_LEVELS. The pool resets the
+                session when a connection is returned, so the level applies
+                to this block only and costs one SET statement per checkout.
+                Defaults to None, which keeps the server default
+                (REPEATABLE READ).
+
+        Yields:
+            PooledMySQLConnection: A connection from the shared pool.
+
+        Raises:
+            mysql.connector.errors.PoolError: If every pooled connection is
+                already checked out.
+            ValueError: If isolation_level is not in ISOLATION_LEVELS.
+
+        Example:
+            >>> with DatabaseManager.get_conn() as conn:
+            ...     with conn.cursor() as cursor:
+            ...         cursor.execute("select count(*) from rooms")
+            ...         (room_count,) = cursor.fetchone()
+        """
+        if isolation_level is not None and isolation_level not in ISOLATION_LEVELS:
+            raise ValueError(f"Unknown isolation level: {isolation_level!r}")
+
+        conn = cls._get_pool().get_connection()
+        try:
+            if isolation_level is not None:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        f"SET SESSION TRANSACTION ISOLATION LEVEL {isolation_level}"
+                    )
+            yield conn
+        except BaseException:
+            if conn.is_connected():
+                conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    @classmethod
+    @contextmanager
+    def transaction(cls, isolation_level: str | None = None):
+        """
+        Run a block as one transaction on a pooled connection.
+
+        The transaction is committed when the block finishes normally and
+        rolled back if it raises, so callers never commit or roll back by
+        hand. To abandon a transaction for a business reason (e.g. a stored
+        procedure reporting failure), raise an exception inside the block.
+
+        Args:
+            isolation_level (str, optional): Passed to get_conn().
+
+        Yields:
+            PooledMySQLConnection: The connection running the transaction.
+
+        Example:
+            >>> with DatabaseManager.transaction() as conn, conn.cursor() as cursor:
+            ...     cursor.execute("update rooms set status = %s where id = %s",
+            ...                    ("MAINTENANCE", "T1"))
+        """
+        with cls.get_conn(isolation_level=isolation_level) as conn:
+            yield conn
+            conn.commit()
+
+    @classmethod
+    def mark_data_changed(cls) -> None:
+        """
+        Record that a write has been committed to the database.
+
+        Repositories call this after every successful commit. It increments
+        the shared data_version counter, which read caches use as part of
+        their key, so cached result sets are never served after a write made
+        by this process. Writes made by other processes or directly in MySQL
+        are not observed.
+
+        Example:
+            >>> version = DatabaseManager.data_version
+            >>> DatabaseManager.mark_data_changed()
+            >>> assert DatabaseManager.data_version == version + 1
+        """
+        cls.data_version += 1
+
     def execute(self, statement, *values) -> cursor:
         """
         Execute a SQL statement with optional parameter values.
@@ -284,7 +467,7 @@ class DatabaseManager:
 
         Performance Notes:
             - New cursor created for each query (ensures isolation)
-            - Consider connection pooling for high-frequency operations
+            - Use get_conn() for pooled, per-operation connections
             - Use batch operations for multiple similar queries
 
         Security Warning:
@@ -295,6 +478,123 @@ class DatabaseManager:
         cursor.execute(statement, values or [])
         return cursor
 
+    def fetch_all(self, statement: str, *values) -> list[tuple]:
+        """
+        Run a single SQL statement as a server-side prepared statement and
+        return all of its rows.
+
+        Unlike execute(), which opens a new cursor per call and hands it to
+        the caller, this keeps one prepared cursor per distinct statement text
+        on this manager's dedicated connection. The server parses and plans
+        each statement once, and later calls only send the parameter values.
+        The rows are read before returning, so no cursor leaves this method.
+
+        Args:
+            statement (str): One SQL statement with %s placeholders. Prepared
+                statements cannot hold several statements or a CALL with OUT
+                parameters; use execute() or get_conn() for those.
+            *values: Values for the placeholders.
+
+        Returns:
+            list[tuple]: Every row of the result (empty for statements that
+                return no rows).
+
+        Raises:
+            mysql.connector.Error: If preparing or executing the statement fails.
+
+        Example:
+            >>> db = DatabaseManager()
+            >>> rows = db.fetch_all(
+            ...     "select id, email from members where status = %s", "ACTIVE"
+            ... )
+        """
+        prepared_cursor = self._prepared.get(statement)
+        if prepared_cursor is None:
+            prepared_cursor = self.connection.cursor(prepared=True)
+            self._prepared[statement] = prepared_cursor
+        prepared_cursor.execute(statement, values or ())
+        return prepared_cursor.fetchall() if prepared_cursor.with_rows else []
+
+
+@functools.lru_cache(maxsize=1)
+def get_db() -> DatabaseManager:
+    """
+    Return the process-wide DatabaseManager, connecting on the first call.
+
+    For code that still wants the legacy execute() interface on a dedicated
+    connection; the repositories borrow pooled connections through
+    get_conn()/transaction() instead. Code that needs a connection with special
+    options (e.g. LOAD DATA LOCAL INFILE) still creates its own
+    DatabaseManager(**connection_options).
+
+    Returns:
+        DatabaseManager: The shared instance.
+
+    Example:
+        >>> get_db() is get_db()
+        True
+    """
+    return DatabaseManager()
+
+
+def db_operation(default, retries: int = DEADLOCK_RETRIES):
+    """
+    Turn mysql.connector errors raised by a repository method into a result.
+
+    The decorated method keeps only its happy path. When InnoDB aborts it as
+    a deadlock victim (ER_LOCK_DEADLOCK, errno 1213) the whole method is run
+    again, up to retries attempts in total, sleeping DEADLOCK_BACKOFF seconds
+    before the first retry and twice as long before each later one. The
+    victim's transaction has already been rolled back by the server (and
+    get_conn() rolls back on the way out), so a rerun starts clean.
+
+    Any other mysql.connector.Error, or a deadlock on the last attempt, is
+    logged with the method name and replaced by a fresh copy of default, so
+    mutable defaults such as [] are never shared between calls.
+
+    Only decorate methods that are safe to run again from the start, i.e.
+    ones that do all their writes in a single transaction.
+
+    Args:
+        default: Value returned when the wrapped method raises a database
+            error (e.g. False for mutators, [] for listings).
+        retries (int): Total attempts on deadlock. Defaults to
+            DEADLOCK_RETRIES.
+
+    Example:
+        >>> class Repository:
+        ...     @db_operation(False)
+        ...     def archive(self, booking_id):
+        ...         with DatabaseManager.transaction() as conn, conn.cursor() as cur:
+        ...             cur.execute("call archive_booking(%s)", (booking_id,))
+        ...         return True
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            for attempt in range(retries):
+                try:
+                    return method(self, *args, **kwargs)
+                except mysql.connector.Error as err:
+                    if err.errno == errorcode.ER_LOCK_DEADLOCK and (
+                        attempt < retries - 1
+                    ):
+                        logger.warning(
+                            "%s deadlocked, retrying (%d/%d)",
+                            method.__qualname__,
+                            attempt + 1,
+                            retries - 1,
+                        )
+                        time.sleep(DEADLOCK_BACKOFF * 2**attempt)
+                        continue
+                    logger.error("%s failed: %s", method.__qualname__, err)
+                    return copy.deepcopy(default)
+
+        return wrapper
+
+    return decorator
+
 
 if __name__ == "__main__":
     """
@@ -340,6 +640,5 @@ if __name__ == "__main__":
             payment_status
         from member_bookings
     """
-    results = database_manager.execute(query)
-    result = results.fetchall()
+    result = database_manager.fetch_all(query)
     print(result)
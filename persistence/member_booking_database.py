@@ -33,6 +33,7 @@ Stored Procedures Used:
     - delete_member(member_id): Removes member from database
     - update_member_password(member_id, password): Updates member password
     - update_member_email(member_id, email): Updates member email address
+    - update_member(member_id, password, email): Updates either or both fields
 
 Classes:
     MemberBookingDatabase: Main database access class for member operations.
@@ -64,11 +65,32 @@ Example:
     ...     print(f"Member: {member[0]}, Email: {member[1]}")
 """
 
-import mysql
-from mysql.connector.cursor_cext import CMySQLCursor
+import functools
+import logging
+import os
+from array import array
+from decimal import Decimal
 
-from persistence import DatabaseManager
-from .models import Member
+from persistence import DatabaseManager, db_operation
+from .models import Member, cached_type_adapter
+from .passwords import hash_password
+
+# Rows per executemany() call in create_new_members(); keeps each multi-row
+# INSERT comfortably below the server's default max_allowed_packet.
+BULK_INSERT_CHUNK_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+# Row type for export_members_json(), which dumps raw show_members() rows
+# without building a Member per row (the rows carry no password anyway). The
+# adapter itself is built by cached_type_adapter() on the first export.
+_MEMBER_ROWS = list[tuple[str, str, Decimal, int]]
+
+
+@functools.lru_cache(maxsize=None)
+def _call_statement(procedure: str, arity: int) -> str:
+    """Build (once per procedure) the parameterized CALL statement text."""
+    return f"call {procedure}({', '.join(['%s'] * arity)});"
 
 
 class MemberBookingDatabase:
@@ -107,8 +129,10 @@ class MemberBookingDatabase:
         - Foreign key constraints handled by stored procedures
 
     Error Handling Strategy:
-        - Catches mysql.connector.Error exceptions
-        - Prints error messages for debugging
+        - Catches mysql.connector.Error exceptions in the shared db_operation
+          decorator, keeping each method body to its happy path
+        - Retries methods chosen as InnoDB deadlock victims (db_operation)
+        - Logs error messages through the module logger
         - Returns False for failed operations
         - Maintains database connection integrity
         - Handles rollback scenarios gracefully
@@ -118,8 +142,11 @@ class MemberBookingDatabase:
         - update_*/delete_* operations: bool (True=success, False=failure)
         - show_members(): List of tuples containing member data
 
-    Attributes:
-        db (DatabaseManager): Database connection and execution manager instance.
+    Connection Handling:
+        Every method borrows a connection from the shared DatabaseManager pool
+        (DatabaseManager.get_conn() / transaction()) for the duration of one
+        operation, as RoomBookingDatabase does. Creating a repository opens
+        no connection, and concurrent callers never share one.
 
     Example:
         >>> # Initialize database access
@@ -147,27 +174,17 @@ class MemberBookingDatabase:
 
     def __init__(self):
         """
-        Initialize the MemberBookingDatabase with a database connection manager.
-
-        Creates a new database access instance by initializing the DatabaseManager
-        which handles MySQL connection management, query execution, and connection
-        pooling. The database manager provides the low-level database operations
-        while this class provides the member-specific business logic.
-
-        Initialization Process:
-            1. Creates DatabaseManager instance for connection management
-            2. Establishes connection pool for efficient database access
-            3. Prepares for stored procedure execution
-            4. Sets up error handling infrastructure
+        Initialize the MemberBookingDatabase.
 
-        Attributes Created:
-            db (DatabaseManager): Database connection and execution manager that
-                provides execute() method for running queries and stored procedures.
+        The repository holds no connection of its own. Each operation borrows
+        a pooled connection from DatabaseManager, which handles MySQL
+        connection management, while this class provides the member-specific
+        business logic.
 
         Connection Details:
             - Uses configuration from DatabaseManager for connection parameters
-            - Establishes MySQL connection with appropriate timeout settings
-            - Enables connection pooling for performance optimization
+            - The shared pool is created on the first database operation
+            - Connections are returned to the pool after every operation
             - Configures for stored procedure execution
 
         Error Handling:
@@ -187,8 +204,11 @@ class MemberBookingDatabase:
             This lazy connection approach improves application startup time
             and resource utilization.
         """
-        self.db = DatabaseManager()
+        # (data_version, rows) of the last show_members() query, see
+        # _show_members_cached()
+        self._members_cache: tuple[int, tuple[tuple, ...]] | None = None
 
+    @db_operation(None)
     def create_new_member(self, member: Member) -> None:
         """
         Create a new member record in the database using validated member data.
@@ -207,13 +227,14 @@ class MemberBookingDatabase:
         Args:
             member (Member): A validated Member object containing:
                 - id (str): Unique member username/identifier
-                - password (str): Member password (will be stored as provided)
+                - password (str): Plaintext member password (hashed client-side
+                  with persistence.passwords.hash_password before the CALL)
                 - email (str): Member email address (must be unique in database)
 
         Returns:
             None: This method performs a database operation and returns nothing.
                   Success is indicated by lack of exception. Failure results
-                  in mysql.connector.Error exception or printed error message.
+                  in mysql.connector.Error exception or a logged error message.
 
         Database Schema Impact:
             - Inserts record into members table
@@ -229,7 +250,7 @@ class MemberBookingDatabase:
 
         Error Handling:
             - Catches mysql.connector.Error for database-related issues
-            - Prints error message to console for debugging
+            - Logs the error through the module logger
             - Does not re-raise exception (silent failure for UI layer)
             - Common errors: duplicate username, duplicate email, constraint violations
 
@@ -266,19 +287,131 @@ class MemberBookingDatabase:
             This method does not return success/failure status. It relies on
             exception handling for error reporting. Consider catching
             mysql.connector.Error in calling code for proper error handling.
-            The stored procedure handles password hashing if required by the
-            database schema design.
+            The password is hashed in the application with scrypt before the
+            CALL, so the stored procedure only stores an opaque hash string.
         """
 
-        try:
-            query = """
-                call insert_new_member(%s, %s, %s);
-            """
-            self.db.execute(query, member.id, member.password, member.email)
-            self.db.connection.commit()
+        with DatabaseManager.transaction() as conn, conn.cursor() as cursor:
+            cursor.execute(
+                _call_statement("insert_new_member", 3),
+                (member.id, hash_password(member.password), member.email),
+            )
+        DatabaseManager.mark_data_changed()
+
+    @db_operation(None)
+    def create_new_members(self, members: list[Member]) -> None:
+        """
+        Create many member records in a single batched, single-commit operation.
+
+        This method is the bulk counterpart of create_new_member(). Instead of
+        issuing one CALL insert_new_member(...) plus one commit per member, it
+        sends the rows with cursor.executemany(), which Connector/Python rewrites
+        into multi-row INSERT statements, and commits once at the end. Importing
+        N members therefore costs a handful of round-trips and one group commit
+        instead of N round-trips and N commits.
+
+        Args:
+            members (list[Member]): Validated Member objects to insert. An empty
+                list is a no-op and does not touch the database.
+
+        Returns:
+            None: Mirrors create_new_member(). Success is indicated by the lack
+                  of an error message; on failure the whole batch is rolled back.
 
-        except mysql.connector.Error as err:
-            print(err)
+        Batching:
+            - Rows are sent in chunks of BULK_INSERT_CHUNK_SIZE (1000) so a very
+              large import never exceeds the server's max_allowed_packet
+            - All chunks share one transaction, so the import is all-or-nothing
+            - A single commit is issued after the last chunk
+
+        Stored Procedure Bypass:
+            insert_new_member only checks for a duplicate id before inserting.
+            The members primary key and the unique email constraint enforce the
+            same rules here, so a duplicate anywhere in the batch raises an
+            IntegrityError and rolls back the entire import.
+
+        Example:
+            >>> member_db = MemberBookingDatabase()
+            >>> member_db.create_new_members([
+            ...     Member(id="alice", password="secure123", email="alice@email.com"),
+            ...     Member(id="bob", password="secure456", email="bob@email.com"),
+            ... ])
+        """
+
+        if not members:
+            return
+
+        query = "insert into members (id, password, email) values (%s, %s, %s)"
+        params = [
+            (member.id, hash_password(member.password), member.email)
+            for member in members
+        ]
+
+        # One transaction: a failure in any chunk rolls back the whole import
+        with DatabaseManager.transaction() as conn, conn.cursor() as cursor:
+            for start in range(0, len(params), BULK_INSERT_CHUNK_SIZE):
+                cursor.executemany(
+                    query, params[start : start + BULK_INSERT_CHUNK_SIZE]
+                )
+        DatabaseManager.mark_data_changed()
+
+    @db_operation(0)
+    def bulk_import_members(self, path: str) -> int:
+        """
+        Import members from a CSV file with a single LOAD DATA LOCAL INFILE.
+
+        This is the fast path for initial data migrations. The client streams
+        the file to the server, which appends the rows through the storage
+        engine's bulk loader. The whole import costs one statement parse and
+        one commit, no matter how many rows the file holds.
+
+        Args:
+            path (str): Path to a comma-separated file with one member per line
+                in the column order id,password,email and no header row.
+
+        Returns:
+            int: Number of member rows loaded, or 0 if the import failed and
+                 was rolled back.
+
+        Connection Requirements:
+            - The import runs on a dedicated connection opened with
+              allow_local_infile_in_path set to the file's directory, so only
+              that directory can be read by the server's LOCAL INFILE request
+            - The server must have local_infile=ON
+
+        Stored Procedure Bypass:
+            Rows do not go through insert_new_member, and the file is streamed
+            to the server untouched, so the password column must already hold
+            hashes produced by persistence.passwords.hash_password(). The
+            procedure's only other logic is the duplicate-id check, which the
+            primary key still enforces, and
+            column defaults (member_since, payment_due, status) are applied by
+            the table definition as usual. If insert_new_member ever gains
+            extra side effects, reproduce them with a trigger or a post-load
+            UPDATE.
+
+        Example:
+            >>> member_db = MemberBookingDatabase()
+            >>> loaded = member_db.bulk_import_members("/srv/imports/members.csv")
+            >>> print(f"Imported {loaded} members")
+        """
+
+        path = os.path.abspath(path)
+        query = """
+            load data local infile %s
+            into table members
+            fields terminated by ','
+            lines terminated by '\\n'
+            (id, password, email);
+        """
+
+        import_db = DatabaseManager(allow_local_infile_in_path=os.path.dirname(path))
+        with import_db.connection.cursor() as cursor:
+            cursor.execute(query, (path,))
+            loaded = cursor.rowcount
+        import_db.connection.commit()
+        DatabaseManager.mark_data_changed()
+        return loaded
 
     def delete_member(self, member_id: str) -> bool:
         """
@@ -331,7 +464,7 @@ class MemberBookingDatabase:
 
         Error Handling:
             - Catches mysql.connector.Error for database issues
-            - Prints detailed error messages for debugging
+            - Logs detailed error messages for debugging
             - Returns False for any error conditions
             - Maintains database connection stability
 
@@ -368,22 +501,7 @@ class MemberBookingDatabase:
             including any cleanup operations for related data.
         """
 
-        try:
-            query = """
-                call delete_member(%s);
-            """
-            result = self.db.execute(query, member_id)
-
-            # Check if any rows were affected
-            if result.rowcount == 0:
-                return False  # No rows affected means member doesn't exist
-
-            self.db.connection.commit()
-            return True
-
-        except mysql.connector.Error as err:
-            print(f"Database error: {err}")
-            return False
+        return self._call_mutating_procedure("delete_member", member_id)
 
     def update_member_password(self, member_id: str, password: str) -> bool:
         """
@@ -404,9 +522,8 @@ class MemberBookingDatabase:
         Args:
             member_id (str): The unique member username/identifier whose password
                 should be updated. Must match exactly with existing member record.
-            password (str): The new password for the member. Password processing
-                (hashing, salting) is handled by the stored procedure according
-                to the database security policy.
+            password (str): The new plaintext password for the member. It is
+                hashed with a fresh salt by update_member() before the CALL.
 
         Returns:
             bool: Password update operation result:
@@ -414,7 +531,7 @@ class MemberBookingDatabase:
                 - False: Member was not found, update failed, or database error occurred
 
         Database Operation:
-            - Calls update_member_password stored procedure
+            - Calls the update_member stored procedure (email left unchanged)
             - Passes member_id and new password as parameters
             - Checks rowcount to verify member existence and update success
             - Commits transaction only on successful update
@@ -425,12 +542,11 @@ class MemberBookingDatabase:
             - Ensures update confirmation before returning success
 
         Password Security:
-            The stored procedure is responsible for:
-            - Password hashing using appropriate algorithms (bcrypt, Argon2, etc.)
-            - Salt generation and application
-            - Password strength validation if required
-            - Compliance with security policies
-            - Audit logging of password changes
+            The password is hashed in the application before the CALL:
+            - scrypt key derivation via persistence.passwords.hash_password
+            - A fresh random salt per hash, stored alongside the digest
+            - The stored procedure only stores the resulting hash string
+            - Key-derivation CPU cost stays off the database server
 
         Transaction Management:
             - Executes update within database transaction
@@ -440,7 +556,7 @@ class MemberBookingDatabase:
 
         Error Handling:
             - Catches mysql.connector.Error for database issues
-            - Prints detailed error messages with context
+            - Logs detailed error messages with context
             - Returns False for any error conditions
             - Maintains stable database connection
 
@@ -466,7 +582,7 @@ class MemberBookingDatabase:
 
         Security Considerations:
             - Password is passed as parameter to prevent SQL injection
-            - Actual password hashing handled by stored procedure
+            - Password is hashed client-side before it reaches the database
             - No plaintext passwords stored in database
             - Password change events logged for security auditing
             - Original password is not required (administrative update)
@@ -487,22 +603,7 @@ class MemberBookingDatabase:
             logic layer before calling this method.
         """
 
-        try:
-            query = """
-                call update_member_password(%s, %s);
-            """
-            result = self.db.execute(query, member_id, password)
-
-            # Check if any rows were affected
-            if result.rowcount == 0:
-                return False  # No rows affected means member doesn't exist
-
-            self.db.connection.commit()
-            return True
-
-        except mysql.connector.Error as err:
-            print(f"Database error: {err}")
-            return False
+        return self.update_member(member_id, password=password)
 
     def update_member_email(self, member_id: str, email: str) -> bool:
         """
@@ -533,7 +634,7 @@ class MemberBookingDatabase:
                 - False: Member not found, email already exists, constraint violation, or database error
 
         Database Operation:
-            - Calls update_member_email stored procedure
+            - Calls the update_member stored procedure (password left unchanged)
             - Passes member_id and new email as parameters
             - Checks rowcount to verify member existence and update success
             - Commits transaction only on successful update
@@ -558,7 +659,7 @@ class MemberBookingDatabase:
 
         Error Handling:
             - Catches mysql.connector.Error for database issues
-            - Prints detailed error messages for debugging
+            - Logs detailed error messages for debugging
             - Returns False for any error conditions
             - Handles constraint violations gracefully
 
@@ -611,24 +712,106 @@ class MemberBookingDatabase:
             maintaining server-side validation for security and data integrity.
         """
 
-        try:
-            query = """
-                call update_member_email(%s, %s);
-            """
-            result = self.db.execute(query, member_id, email)
+        return self.update_member(member_id, email=email)
+
+    def update_member(
+        self,
+        member_id: str,
+        *,
+        password: str | None = None,
+        email: str | None = None,
+    ) -> bool:
+        """
+        Update a member's password, email, or both in a single procedure call.
+
+        This method calls the update_member stored procedure, which applies all
+        requested changes in one UPDATE of the member's row. Fields passed as
+        None keep their current value (the procedure COALESCEs them), so
+        changing both password and email during account recovery costs one
+        round-trip and one commit instead of two of each.
+        update_member_password() and update_member_email() are thin wrappers
+        around this method.
+
+        Args:
+            member_id (str): The unique member username/identifier to update.
+            password (str | None): New password, or None to keep the current one.
+            email (str | None): New email address, or None to keep the current
+                one. Must be unique across all members.
+
+        Returns:
+            bool: True if the member was found and updated, False if there was
+                  nothing to update, the member was not found, or a database
+                  error occurred (e.g. duplicate email).
+
+        Example:
+            >>> member_db = MemberBookingDatabase()
+            >>> member_db.update_member(
+            ...     "john_doe", password="new_secure_pw", email="john@newmail.com"
+            ... )
+            True
+        """
+        if password is None and email is None:
+            return False
+
+        if password is not None:
+            password = hash_password(password)
+
+        return self._call_mutating_procedure(
+            "update_member", member_id, password, email
+        )
+
+    @db_operation(False)
+    def _call_mutating_procedure(self, procedure: str, *args) -> bool:
+        """
+        Call a member-mutating stored procedure and report whether it took effect.
+
+        delete_member(), update_member_password() and update_member_email() all
+        follow the same pattern: call a stored procedure with positional
+        parameters, treat a zero row count as "member not found", commit
+        otherwise and turn database errors into a False result. This helper
+        holds that pattern once so the public methods only name the procedure
+        and pass its arguments.
+
+        Args:
+            procedure (str): Name of the stored procedure to call.
+            *args: Positional parameters, bound in order to the procedure's
+                IN parameters.
+
+        Returns:
+            bool: True if the procedure affected at least one row and the
+                  transaction was committed, False if no rows were affected
+                  or a database error occurred.
+
+        Commit Handling:
+            commit() is only issued once a row was actually changed. A no-op
+            call (rowcount == 0) returns before reaching it, so lookups for
+            unknown members and retried updates cost a single round-trip
+            instead of two.
+
+        Statement Execution:
+            The CALL is sent as one parameterized statement on a short-lived
+            cursor that is closed as soon as the row count is read.
+            cursor.callproc() is deliberately not used: Connector/Python
+            implements it as a SET per argument, the CALL itself and a final
+            SELECT of the argument variables, so it costs several round-trips
+            where this costs one.
+        """
+        with DatabaseManager.get_conn() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(_call_statement(procedure, len(args)), args)
+                rowcount = cursor.rowcount
 
             # Check if any rows were affected
-            if result.rowcount == 0:
+            if rowcount == 0:
                 return False  # No rows affected means member doesn't exist
 
-            self.db.connection.commit()
-            return True
+            conn.commit()
 
-        except mysql.connector.Error as err:
-            print(f"Database error: {err}")
-            return False
+        DatabaseManager.mark_data_changed()
+        return True
 
-    def show_members(self) -> CMySQLCursor:
+    @db_operation([])
+    def show_members(self) -> list[tuple]:
         """
         Retrieve all member records from the database for display and reporting purposes.
 
@@ -638,7 +821,8 @@ class MemberBookingDatabase:
         registration date for consistent and meaningful presentation.
 
         Query Details:
-            - Selects: id (username), email, payment_due
+            - Selects: id (username), email, payment_due,
+              UNIX_TIMESTAMP(member_since)
             - Source: members table
             - Ordering: member_since DESC (newest members first)
             - No filtering: Returns all active members
@@ -648,6 +832,7 @@ class MemberBookingDatabase:
                 - [0] id (str): Member username/unique identifier
                 - [1] email (str): Member email address
                 - [2] payment_due (float/Decimal): Outstanding payment amount
+                - [3] member_since_epoch (int): Registration time as Unix seconds
 
             Returns empty list if no members exist or database error occurs.
 
@@ -656,6 +841,9 @@ class MemberBookingDatabase:
             - Index 0: Member ID (primary key, unique username)
             - Index 1: Email address (unique, contact information)
             - Index 2: Payment due amount (financial status indicator)
+            - Index 3: Registration time as an epoch integer. The driver does
+              not build a datetime object per row; convert with
+              datetime.fromtimestamp() only when the value is displayed.
 
         Sorting Logic:
             - Results ordered by member_since column in descending order
@@ -665,11 +853,14 @@ class MemberBookingDatabase:
 
         Error Handling:
             - Catches mysql.connector.Error for database issues
-            - Prints error messages to console for debugging
-            - Returns empty result set on error conditions
+            - Logs error messages through the module logger
+            - Returns an empty list on error conditions
             - Maintains application stability during database issues
 
         Performance Considerations:
+            - Results are memoized until the next committed write made by
+              this process (see DatabaseManager.data_version), so repeated
+              admin listings do not re-query MySQL
             - Retrieves all member records (no pagination)
             - Suitable for small to medium member databases
             - Consider implementing pagination for large datasets
@@ -681,7 +872,7 @@ class MemberBookingDatabase:
             >>>
             >>> # Display member information
             >>> for member in members:
-            ...     username, email, payment_due = member
+            ...     username, email, payment_due, member_since_epoch = member
             ...     print(f"Member: {username}")
             ...     print(f"Email: {email}")
             ...     print(f"Payment Due: ${payment_due:.2f}")
@@ -727,6 +918,76 @@ class MemberBookingDatabase:
             information useful for administrative and billing purposes.
         """
 
+        return list(self._show_members_cached(DatabaseManager.data_version))
+
+    def _show_members_cached(self, data_version: int) -> tuple[tuple, ...]:
+        """
+        Run the show_members() query, memoized per shared data version.
+
+        The last result is kept on the instance as a (data_version, rows)
+        pair. Any committed write made through a repository in this process
+        bumps DatabaseManager.data_version, so the next call misses the cache
+        and re-queries. This includes bookings, which change payment_due.
+        Errors propagate and are never cached. A tuple is cached so callers
+        cannot mutate the shared result.
+        """
+        cached = self._members_cache
+        if cached is not None and cached[0] == data_version:
+            return cached[1]
+
+        query = """
+            select
+                id,
+                email,
+                payment_due,
+                unix_timestamp(member_since) as member_since_epoch
+            from members
+            order by member_since desc;
+        """
+
+        with DatabaseManager.get_conn() as conn, conn.cursor() as cursor:
+            cursor.execute(query)
+            rows = tuple(cursor.fetchall())
+
+        self._members_cache = (data_version, rows)
+        return rows
+
+    @db_operation({"id": [], "email": [], "payment_due": array("q")})
+    def show_members_columnar(self) -> dict[str, list | array]:
+        """
+        Retrieve all member records as columns instead of per-row tuples.
+
+        This is the column-oriented (structure-of-arrays) counterpart of
+        show_members(). The same query is executed, but the cursor is consumed
+        row by row into one list per column, so no intermediate list of row
+        tuples is built and consumers that work on a whole column at a time
+        (totals, exports, column formatting) do not need to unpack every row.
+
+        Returns:
+            dict[str, list | array]: Column name mapped to the column values, in the
+                same order as show_members() (newest members first):
+                - "id": Member usernames
+                - "email": Member email addresses
+                - "payment_due": Outstanding payment amounts as an
+                  array("q") of integer cents
+
+            When there are no members or a database error occurs, "id" and
+            "email" are empty lists and "payment_due" is an empty array("q").
+
+        Example:
+            >>> member_db = MemberBookingDatabase()
+            >>> columns = member_db.show_members_columnar()
+            >>> total_due = sum(columns["payment_due"]) / 100
+            >>> print(f"{len(columns['id'])} members owe ${total_due:.2f}")
+
+        Payment Storage:
+            payment_due is converted to integer cents at fetch time and packed
+            into a typed array, costing 8 bytes per member instead of a full
+            Decimal object. The column is DECIMAL(10,2), so the conversion is
+            exact to 1 cent and every value fits in a signed 64-bit integer.
+            Divide by 100 only when an amount is displayed.
+        """
+
         query = """
             select
                 id,
@@ -736,11 +997,39 @@ class MemberBookingDatabase:
             order by member_since desc;
         """
 
-        try:
-            results = self.db.execute(query)
-            return results.fetchall()
-        except mysql.connector.Error as err:
-            print(err)
+        ids: list[str] = []
+        emails: list[str] = []
+        payments_due = array("q")
+
+        with DatabaseManager.get_conn() as conn, conn.cursor() as cursor:
+            cursor.execute(query)
+            for member_id, email, payment_due in cursor:
+                ids.append(member_id)
+                emails.append(email)
+                payments_due.append(round(payment_due * 100))
+
+        return {"id": ids, "email": emails, "payment_due": payments_due}
+
+    def export_members_json(self) -> bytes:
+        """
+        Export every member listed by show_members() as a JSON document.
+
+        The rows are serialized straight from the query result in one
+        pydantic-core pass, without validating or constructing a Member model
+        per row. Each member becomes a JSON array of
+        [id, email, payment_due, member_since_epoch]. payment_due is emitted as
+        a string so the DECIMAL(10,2) value is exported exactly.
+
+        Returns:
+            bytes: UTF-8 encoded JSON array, b"[]" when there are no members or
+                   the underlying query fails.
+
+        Example:
+            >>> member_db = MemberBookingDatabase()
+            >>> with open("members.json", "wb") as export_file:
+            ...     export_file.write(member_db.export_members_json())
+        """
+        return cached_type_adapter(_MEMBER_ROWS).dump_json(self.show_members())
 
 
 if __name__ == "__main__":
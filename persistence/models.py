@@ -13,17 +13,56 @@ Classes:
     Member: Represents a registered user/member in the system.
     SearchRoom: Represents room search criteria with date and time constraints.
     Booking: Represents a room booking with associated member and schedule details.
+    BookingColumns: Column-oriented buffer for booking list query results.
+    MemberDict, SearchRoomDict, BookingDict: TypedDict mirrors of the models
+        for internal dict hand-offs.
+    BookingRecordDict: Plain-dict shape of one booking listing row.
+    BookingRow: Named tuple for one booking listing row.
+
+Module Attributes:
+    BookDate: Strict date field type shared by SearchRoom and Booking.
+    BookTime: Strict time field type shared by SearchRoom and Booking.
+    ENABLE_PYDANTIC_VALIDATION: Whether new bookings are built through full
+        pydantic validation (see booking_from_payload_fast).
+    MEMBER_LIST_ADAPTER: Shared TypeAdapter for lists of Member, built on
+        first access.
+    BOOKING_LIST_ADAPTER: Shared TypeAdapter for lists of Booking, built on
+        first access.
+
+Import Cost:
+    Importing this module does not build any pydantic-core schema. The models
+    use defer_build=True, so each model compiles its validator the first time
+    it validates data, and the list adapters are created on first attribute
+    access through the module-level __getattr__ (PEP 562). Code that imports
+    persistence but never touches a model, such as the member and room
+    listings, pays nothing for the schemas.
+
+Functions:
+    cached_type_adapter: Build (once) and return a shared TypeAdapter for a type.
+    decode_members: Parse a JSON array straight into a list of Member.
+    decode_bookings: Parse a JSON array straight into a list of Booking.
+    make_member_trusted: Build a Member from trusted data, skipping validation.
+    make_booking_trusted: Build a Booking from trusted data, skipping validation.
+    booking_from_payload_fast: Check a booking payload by hand, without pydantic.
+    decode_member: Parse a JSON document straight into a validated Member.
+    decode_search_room: Parse a JSON document straight into a SearchRoom.
+    decode_booking: Parse a JSON document straight into a Booking.
 
 Dependencies:
     - datetime.date: Date handling for booking dates
     - datetime.time: Time handling for booking times
     - pydantic.BaseModel: Base class providing validation and serialization
+    - pydantic.ConfigDict: Shared model configuration (see _FrozenModel)
+    - dataclasses, json: Column buffer for booking lists (see BookingColumns)
 
 Features:
     - Automatic data validation through Pydantic
     - Type safety with Python type hints
     - JSON serialization/deserialization support
-    - Immutable data structures for data integrity
+    - Immutable, hashable data structures (frozen=True) for data integrity
+    - Unknown fields rejected at validation time (extra="forbid")
+    - JSON output via pydantic-core's Rust serializer (model_dump_json and
+      the list adapters); there is no hand-written JSON override
     - Clear separation of business entities
 
 Example:
@@ -53,14 +92,100 @@ Design Patterns:
     - Data Transfer Object (DTO): Clean data structures for layer communication
     - Value Object: Immutable data representations
     - Domain Model: Business entity representations
+
+Constrained Strings:
+    No field currently carries a pattern or length constraint. If one is
+    added (for example a pattern for room IDs), define it once as a RootModel
+    subclass here, e.g. class RoomId(RootModel[str]), and use that type in
+    every model that needs it. pydantic then builds the regex validator once
+    and shares it, instead of compiling a copy for each annotated field.
 """
 
-from datetime import date, time
+import functools
+import json
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from typing import Annotated, NamedTuple, TypedDict
+
+from pydantic import BaseModel, ConfigDict, Field, Strict, TypeAdapter
+
+__all__ = [
+    "Member",
+    "SearchRoom",
+    "Booking",
+    "BookingColumns",
+    "MemberDict",
+    "SearchRoomDict",
+    "BookingDict",
+    "BookingRecordDict",
+    "BookingRow",
+    "BookDate",
+    "BookTime",
+    "MEMBER_LIST_ADAPTER",
+    "BOOKING_LIST_ADAPTER",
+    "cached_type_adapter",
+    "make_member_trusted",
+    "make_booking_trusted",
+    "booking_from_payload_fast",
+    "ENABLE_PYDANTIC_VALIDATION",
+    "decode_member",
+    "decode_search_room",
+    "decode_booking",
+    "decode_members",
+    "decode_bookings",
+]
+
+
+# Shared field types for SearchRoom and Booking. Declaring the strict date and
+# time fields once keeps their semantics identical across both models.
+BookDate = Annotated[date, Strict(), Field(description="Booking date")]
+BookTime = Annotated[time, Strict(), Field(description="Booking start time")]
+
+
+class _FrozenModel(BaseModel):
+    """
+    Shared base class holding the configuration of every persistence model.
+
+    The models are plain data carriers, so they are all configured the same
+    way:
+        - frozen=True: instances are immutable and hashable
+        - extra="forbid": unknown fields are rejected, and extras are never
+          collected or stored
+        - str_strip_whitespace=False, validate_assignment=False: the pydantic
+          defaults, stated explicitly so strings are validated as-is and no
+          assignment validator is installed
+        - str_min_length=None, str_max_length=None: no length constraints,
+          so pydantic-core does not build a length check for str fields.
+          Fields stay plain str (never EmailStr or constr), which keeps the
+          optional email-validator dependency out of the construction path;
+          email format is checked once, at input time, by
+          MemberInputService
+        - defer_build=True: the validator and serializer are built on first
+          use instead of at class creation, keeping import cheap
+        - cache_strings="keys": JSON decoding reuses one interned str per
+          field name ("id", "book_date", ...), while field values such as
+          passwords and emails, which are nearly always unique, do not
+          pollute pydantic-core's string cache
+
+    Keeping the configuration in one place means the three models cannot
+    drift apart.
+    """
 
-from pydantic import BaseModel
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        str_strip_whitespace=False,
+        validate_assignment=False,
+        str_min_length=None,
+        str_max_length=None,
+        defer_build=True,
+        cache_strings="keys",
+    )
 
 
-class Member(BaseModel):
+class Member(_FrozenModel):
     """
     Represents a registered member/user in the sports booking system.
 
@@ -132,11 +257,13 @@ class Member(BaseModel):
     """
 
     id: str
-    password: str
+    # repr=False keeps the (hashed or plaintext) password out of repr() and
+    # therefore out of log lines and tracebacks; serialization is unchanged.
+    password: str = Field(repr=False)
     email: str
 
 
-class SearchRoom(BaseModel):
+class SearchRoom(_FrozenModel):
     """
     Represents search criteria for finding available rooms in the sports booking system.
 
@@ -158,7 +285,9 @@ class SearchRoom(BaseModel):
                          Represents the start time of the desired booking period.
 
     Validation Features:
-        - Automatic date/time format validation
+        - Strict date/time fields: Python callers must pass date/time objects,
+          so no string parsing runs on the hot path (JSON input via
+          decode_search_room() still accepts ISO strings)
         - Type checking for all search parameters
         - Immutable search criteria structure
         - JSON serialization for API compatibility
@@ -217,11 +346,11 @@ class SearchRoom(BaseModel):
     """
 
     room_type: str
-    book_date: date
-    book_time: time
+    book_date: BookDate
+    book_time: BookTime
 
 
-class Booking(BaseModel):
+class Booking(_FrozenModel):
     """
     Represents a confirmed room booking in the sports booking system.
 
@@ -246,7 +375,9 @@ class Booking(BaseModel):
                    References the Member.id field for ownership tracking.
 
     Validation Features:
-        - Automatic date/time validation through Pydantic
+        - Strict date/time fields: Python callers must pass date/time objects,
+          so no string parsing runs on the hot path (JSON input via
+          decode_booking() still accepts ISO strings)
         - Type safety for all booking attributes
         - Immutable booking record after creation
         - JSON serialization for storage and API operations
@@ -285,14 +416,12 @@ class Booking(BaseModel):
             'user': 'member_123'
         }
 
-        >>> # Create booking from API data
-        >>> api_data = {
-        ...     "room_id": "tennis_court_a",
-        ...     "book_date": "2025-08-26",
-        ...     "book_time": "10:00:00",
-        ...     "user": "alice_smith"
-        ... }
-        >>> booking = Booking(**api_data)
+        >>> # Create booking from JSON API data (ISO strings are parsed here)
+        >>> api_json = (
+        ...     '{"room_id": "tennis_court_a", "book_date": "2025-08-26",'
+        ...     ' "book_time": "10:00:00", "user": "alice_smith"}'
+        ... )
+        >>> booking = decode_booking(api_json)
 
         >>> # Access booking details
         >>> print(f"Room: {booking.room_id}")
@@ -329,77 +458,403 @@ class Booking(BaseModel):
         in related database tables or extended models.
     """
 
+    room_id: str
+    book_date: BookDate
+    book_time: BookTime
+    user: str
+
+
+# TypedDict mirrors of the models. They give dict hand-offs inside the
+# persistence and service layers static typing with no runtime cost (no
+# __init__, no validation); build a model only when attribute access or
+# validation is actually needed.
+class MemberDict(TypedDict):
+    """Plain-dict mirror of Member."""
+
+    id: str
+    password: str
+    email: str
+
+
+class SearchRoomDict(TypedDict):
+    """Plain-dict mirror of SearchRoom."""
+
+    room_type: str
+    book_date: date
+    book_time: time
+
+
+class BookingDict(TypedDict):
+    """Plain-dict mirror of Booking."""
+
     room_id: str
     book_date: date
     book_time: time
     user: str
 
 
-if __name__ == "__main__":
+class BookingRecordDict(TypedDict):
+    """
+    Plain-dict form of one row of the booking listing (member_bookings).
+
+    Used where listing rows go straight to JSON output, e.g.
+    RoomBookingDatabase.export_bookings_json(), so no model instance is built
+    per row. datetime_of_booking is an ISO 8601 string.
     """
-    Demonstration and testing module for Pydantic models.
-    
-    This section provides practical examples of model usage, demonstrating
-    how to create, validate, and work with the sports booking system models.
-    It serves both as documentation and as a basic test to verify model
-    functionality and validation capabilities.
-    
-    The examples show:
-    - Model instantiation with valid data
-    - Automatic validation through Pydantic
-    - JSON serialization capabilities
-    - Model representation and display
-    
-    Usage:
-        Run this module directly to see model examples:
-        $ python models.py
-    
-    Expected Output:
-        Display of a sample Member object with all its attributes
-        formatted according to Pydantic's default representation.
-    
-    Example Output:
-        Member(id='shalow21', password='HelloWorld21', email='shalow21@gmail.com')
-    
-    Additional Examples:
-        The following examples demonstrate extended model usage:
+
+    room_id: str
+    room_type: str
+    datetime_of_booking: str
+    member_id: str
+    payment_status: str
+
+
+class BookingRow(NamedTuple):
     """
-    # Original example - Member creation and display
-    member = Member(id="shalow21", password="HelloWorld21", email="shalow21@gmail.com")
-    print("Member Example:")
-    print(member)
-    print()
-
-    # Additional examples for demonstration
-    from datetime import date, time
-
-    # SearchRoom example
-    search = SearchRoom(
-        room_type="gymnasium", book_date=date(2025, 8, 25), book_time=time(14, 30)
-    )
-    print("SearchRoom Example:")
-    print(search)
-    print(
-        f"Searching for: {search.room_type} on {search.book_date} at {search.book_time}"
-    )
-    print()
-
-    # Booking example
-    booking = Booking(
-        room_id="gym_001",
-        book_date=date(2025, 8, 25),
-        book_time=time(14, 30),
-        user="shalow21",
-    )
-    print("Booking Example:")
-    print(booking)
-    print(
-        f"Booking: {booking.room_id} for {booking.user} on {booking.book_date} at {booking.book_time}"
-    )
-    print()
+    One row of the booking listing (member_bookings) with attribute access.
+
+    A named tuple is a tuple, so rows still unpack and index exactly like the
+    plain tuples returned by the cursor, and cost no more memory than them;
+    a dict per row would be several times larger.
+    """
+
+    room_id: str
+    room_type: str
+    datetime_of_booking: datetime
+    member_id: str
+    payment_status: str
+
+
+@dataclass(slots=True)
+class BookingColumns:
+    """
+    Column-oriented (structure-of-arrays) buffer for booking list results.
+
+    Listing queries can return many rows. Instead of one object per booking,
+    this keeps one plain list per column of the member_bookings listing, so a
+    result costs five list objects no matter how many rows it holds. Row i is
+    (room_ids[i], room_types[i], booked_at[i], member_ids[i],
+    payment_statuses[i]).
+
+    Attributes:
+        room_ids (list[str]): Booked room identifiers.
+        room_types (list[str]): Facility type of each booked room.
+        booked_at (list[datetime]): Date and time of each booking.
+        member_ids (list[str]): Members who made the bookings.
+        payment_statuses (list[str]): Payment status of each booking.
+
+    Example:
+        >>> columns = BookingColumns.from_rows(
+        ...     [("T1", "Tennis Court", datetime(2025, 8, 25, 14, 30), "alice", "Unpaid")]
+        ... )
+        >>> columns.room_ids
+        ['T1']
+        >>> len(columns)
+        1
+    """
+
+    room_ids: list[str] = field(default_factory=list)
+    room_types: list[str] = field(default_factory=list)
+    booked_at: list[datetime] = field(default_factory=list)
+    member_ids: list[str] = field(default_factory=list)
+    payment_statuses: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_rows(cls, rows) -> "BookingColumns":
+        """
+        Transpose (room_id, room_type, datetime_of_booking, member_id,
+        payment_status) rows into columns.
+
+        Args:
+            rows: Iterable of 5-tuples as returned by the booking listing query.
+
+        Returns:
+            BookingColumns: The same data, one list per column.
+        """
+        columns = tuple(zip(*rows))
+        if not columns:
+            return cls()
+        return cls(*(list(column) for column in columns))
+
+    def __len__(self) -> int:
+        return len(self.room_ids)
+
+    def count_by(self, column: str) -> Counter:
+        """
+        Count bookings per distinct value of one column.
+
+        Counter consumes the column list in C, so aggregates such as bookings
+        per room type or unpaid bookings need no per-row Python loop.
+
+        Args:
+            column (str): Name of a column attribute, e.g. "room_types" or
+                "payment_statuses".
+
+        Returns:
+            Counter: Number of bookings for each value of the column.
+
+        Raises:
+            AttributeError: If column is not a BookingColumns attribute.
+
+        Example:
+            >>> columns.count_by("payment_statuses")["Unpaid"]
+            1
+        """
+        return Counter(getattr(self, column))
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the bookings as a JSON array of row objects.
+
+        The rows are produced by zipping the columns, so no intermediate
+        per-row model is built. Booking times are written as ISO 8601 strings.
+
+        Returns:
+            bytes: UTF-8 encoded JSON array.
+        """
+        return json.dumps(
+            [
+                {
+                    "room_id": room_id,
+                    "room_type": room_type,
+                    "datetime_of_booking": booked_at.isoformat(),
+                    "member_id": member_id,
+                    "payment_status": payment_status,
+                }
+                for room_id, room_type, booked_at, member_id, payment_status in zip(
+                    self.room_ids,
+                    self.room_types,
+                    self.booked_at,
+                    self.member_ids,
+                    self.payment_statuses,
+                )
+            ],
+            separators=(",", ":"),
+        ).encode()
+
+
+@functools.lru_cache(maxsize=None)
+def cached_type_adapter(tp) -> TypeAdapter:
+    """
+    Return a TypeAdapter for tp, building it only on the first request.
+
+    Building a TypeAdapter compiles a pydantic-core schema, which costs far
+    more than using one. Code that needs an adapter for the same type over
+    and over should get it through this function instead of calling
+    TypeAdapter(tp) each time.
+
+    Args:
+        tp: Any type pydantic can validate, e.g. list[Booking].
+
+    Returns:
+        TypeAdapter: The shared adapter for tp.
+    """
+    return TypeAdapter(tp)
+
+
+# Batch (de)serializers, built once on first access via __getattr__ below.
+# dump_json() and validate_json() on a whole list run in a single pydantic-core
+# pass instead of one model call per instance.
+# Usage: MEMBER_LIST_ADAPTER.dump_json(members)
+_LAZY_ADAPTER_TYPES = {
+    "MEMBER_LIST_ADAPTER": list[Member],
+    "BOOKING_LIST_ADAPTER": list[Booking],
+}
+
+
+def __getattr__(name: str):
+    """Build the list adapters lazily on first module attribute access."""
+    if name in _LAZY_ADAPTER_TYPES:
+        return cached_type_adapter(_LAZY_ADAPTER_TYPES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def decode_members(raw: str | bytes) -> list[Member]:
+    """Parse and validate a JSON array of members in a single pass."""
+    return cached_type_adapter(list[Member]).validate_json(raw)
+
+
+def decode_bookings(raw: str | bytes) -> list[Booking]:
+    """Parse and validate a JSON array of bookings in a single pass."""
+    return cached_type_adapter(list[Booking]).validate_json(raw)
+
+
+# Per-model constructors generated by _trusted_constructor(), keyed by class.
+_TRUSTED_CONSTRUCTORS: dict[type[BaseModel], object] = {}
+
+
+def _trusted_constructor(model: type[BaseModel]):
+    """
+    Return a specialised constructor for model, generating it on first use.
+
+    The constructor is emitted as straight-line Python source that reads each
+    known field from a dict, checks its type with isinstance() and calls
+    model_construct() with keyword arguments, then compiled with exec(). This
+    avoids pydantic's generic validation loop while still rejecting values of
+    the wrong type. Generated functions are cached in _TRUSTED_CONSTRUCTORS.
+
+    Args:
+        model: A model class whose fields are all plain classes (str, date, ...).
+
+    Returns:
+        Callable[[dict], model]: The generated constructor.
+    """
+    constructor = _TRUSTED_CONSTRUCTORS.get(model)
+    if constructor is not None:
+        return constructor
+
+    namespace = {"construct": model.model_construct}
+    lines = ["def construct_trusted(d):"]
+    for index, (name, info) in enumerate(model.model_fields.items()):
+        namespace[f"_t{index}"] = info.annotation
+        lines.append(f"    {name} = d[{name!r}]")
+        lines.append(f"    if not isinstance({name}, _t{index}):")
+        lines.append(
+            f"        raise TypeError('{model.__name__}.{name}: expected "
+            f"{info.annotation.__name__}, got ' + type({name}).__name__)"
+        )
+    arguments = ", ".join(f"{name}={name}" for name in model.model_fields)
+    lines.append(f"    return construct({arguments})")
+
+    exec("\n".join(lines), namespace)
+    constructor = _TRUSTED_CONSTRUCTORS[model] = namespace["construct_trusted"]
+    return constructor
+
+
+# Set TRUSTED_CROSS_CHECK=1 to also run full pydantic validation inside the
+# make_*_trusted() helpers, so a trusted call site that drifts from the schema
+# fails loudly (e.g. while debugging). Off by default: the helpers exist to
+# skip validation.
+TRUSTED_CROSS_CHECK: bool = os.getenv("TRUSTED_CROSS_CHECK", "0") == "1"
+
+
+def make_member_trusted(data: MemberDict) -> Member:
+    """
+    Build a Member from already-validated data without running validation.
+
+    Member.model_construct() only assigns the fields, skipping pydantic's
+    validators and type coercion. Use it only for trusted sources such as
+    rows read back from the members table or values taken from another
+    Member. Input from users or external systems must still go through
+    Member(...) or decode_member().
+
+    Construction goes through a generated constructor (see
+    _trusted_constructor()) that type-checks each field with isinstance()
+    before calling Member.model_construct().
+
+    Full validation is not run unless TRUSTED_CROSS_CHECK is enabled
+    (environment variable TRUSTED_CROSS_CHECK=1), in which case the data is
+    also passed through Member.model_validate() so a trusted call site that
+    drifts from the schema fails loudly.
+
+    Args:
+        data (MemberDict): Field values keyed by field name (id, password, email).
+
+    Returns:
+        Member: An unvalidated Member instance holding exactly the given values.
+    """
+    if TRUSTED_CROSS_CHECK:
+        Member.model_validate(data)
+    return _trusted_constructor(Member)(data)
+
+
+def make_booking_trusted(data: BookingDict) -> Booking:
+    """
+    Build a Booking from already-validated data without running validation.
+
+    The trusted-source rules, the opt-in TRUSTED_CROSS_CHECK validation and
+    the generated constructor are the same as for make_member_trusted().
+
+    Args:
+        data (BookingDict): Field values keyed by field name
+            (room_id, book_date, book_time, user).
+
+    Returns:
+        Booking: An unvalidated Booking instance holding exactly the given values.
+    """
+    if TRUSTED_CROSS_CHECK:
+        Booking.model_validate(data)
+    return _trusted_constructor(Booking)(data)
+
+
+# Set ENABLE_PYDANTIC_VALIDATION=0 to build new bookings through
+# booking_from_payload_fast() + make_booking_trusted() instead of Booking(...),
+# e.g. to compare booking latency with and without the validator round trip.
+# The "off" path runs no pydantic validation at all (see TRUSTED_CROSS_CHECK).
+ENABLE_PYDANTIC_VALIDATION: bool = os.getenv("ENABLE_PYDANTIC_VALIDATION", "1") != "0"
+
+# Column widths of member_bookings.room_id and member_bookings.member_id.
+_ROOM_ID_MAX_LENGTH = 10
+_MEMBER_ID_MAX_LENGTH = 50
+
+
+def booking_from_payload_fast(payload: dict) -> BookingDict:
+    """
+    Check a booking payload by hand and return it as a BookingDict.
+
+    This is the no-pydantic path for booking creation. It performs only the
+    checks the database would otherwise reject late (types and column widths)
+    and copies the four fields into a fresh dict, dropping any extra keys.
+    The make_booking procedure still enforces availability, member existence
+    and every other business rule.
+
+    Args:
+        payload (dict): Mapping with room_id, book_date, book_time and user.
+
+    Returns:
+        BookingDict: The four booking fields, suitable for make_booking_trusted()
+              or for passing straight to RoomBookingDatabase.book_room().
+
+    Raises:
+        KeyError: If a required field is missing.
+        ValueError: If a field has the wrong type or exceeds its column width.
+    """
+    room_id = payload["room_id"]
+    book_date = payload["book_date"]
+    book_time = payload["book_time"]
+    user = payload["user"]
+
+    if not isinstance(room_id, str) or not 0 < len(room_id) <= _ROOM_ID_MAX_LENGTH:
+        raise ValueError(f"Invalid room_id: {room_id!r}")
+    if not isinstance(user, str) or not 0 < len(user) <= _MEMBER_ID_MAX_LENGTH:
+        raise ValueError(f"Invalid user: {user!r}")
+    # datetime subclasses date but strict Booking.book_date rejects it, so it
+    # is rejected here too and both paths accept the same input.
+    if not isinstance(book_date, date) or isinstance(book_date, datetime):
+        raise ValueError(f"Invalid book_date: {book_date!r}")
+    if not isinstance(book_time, time):
+        raise ValueError(f"Invalid book_time: {book_time!r}")
+
+    return {
+        "room_id": room_id,
+        "book_date": book_date,
+        "book_time": book_time,
+        "user": user,
+    }
+
+
+def decode_member(raw: str | bytes) -> Member:
+    """
+    Parse and validate a JSON document directly into a Member.
+
+    model_validate_json() hands the raw bytes to pydantic-core, which parses
+    and validates them in one Rust pass. Unlike Member(**json.loads(raw)), no
+    intermediate Python dict is built. Use this for JSON input from outside
+    the process, e.g. import files or queued requests.
+
+    Raises:
+        pydantic.ValidationError: If the JSON is malformed or does not match
+            the Member schema.
+    """
+    return Member.model_validate_json(raw)
+
+
+def decode_search_room(raw: str | bytes) -> SearchRoom:
+    """Parse and validate a JSON document directly into a SearchRoom."""
+    return SearchRoom.model_validate_json(raw)
+
+
+def decode_booking(raw: str | bytes) -> Booking:
+    """Parse and validate a JSON document directly into a Booking."""
+    return Booking.model_validate_json(raw)
 
-    # JSON serialization example
-    print("JSON Serialization Examples:")
-    print("Member JSON:", member.model_dump_json())
-    print("SearchRoom JSON:", search.model_dump_json())
-    print("Booking JSON:", booking.model_dump_json())
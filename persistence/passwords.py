@@ -0,0 +1,118 @@
+"""
+Password hashing utilities for the Sports Booking Management System.
+
+This module hashes member passwords on the application side before they are
+sent to MySQL, so the stored procedures only ever receive and store an opaque
+hash string. Keeping the key-derivation work in the client spreads its CPU cost
+across application processes and keeps it outside the database's row-lock
+critical section.
+
+Hashes use the memory-hard scrypt key-derivation function from the standard
+library (hashlib.scrypt), so no extra dependency is required. Each hash is
+self-describing and stores its own parameters and random salt:
+
+    scrypt$<n>$<r>$<p>$<salt_b64>$<hash_b64>
+
+Stored hashes therefore stay verifiable if the default cost parameters are
+raised later.
+
+Functions:
+    hash_password: Derive a salted, encoded scrypt hash for a plaintext password.
+    verify_password: Check a plaintext password against a stored hash.
+
+Example:
+    >>> stored = hash_password("SecurePassword123!")
+    >>> stored.startswith("scrypt$")
+    True
+    >>> verify_password("SecurePassword123!", stored)
+    True
+    >>> verify_password("wrong-password", stored)
+    False
+
+Security Note:
+    The encoded hash is about 90 characters long and fits the members.password
+    VARCHAR(255) column. Plaintext passwords never reach the database.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+
+SCRYPT_N = 2**14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_BYTES = 16
+HASH_BYTES = 32
+
+_SCHEME = "scrypt"
+
+
+def hash_password(password: str) -> str:
+    """
+    Derive a salted scrypt hash for a plaintext password.
+
+    Args:
+        password (str): The plaintext password entered by the member.
+
+    Returns:
+        str: Encoded hash in the form scrypt$n$r$p$salt$hash, ready to be
+             stored in the members.password column.
+
+    Example:
+        >>> hash_password("hello_world_21").split("$")[0]
+        'scrypt'
+    """
+    salt = os.urandom(SALT_BYTES)
+    derived = hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=SCRYPT_N,
+        r=SCRYPT_R,
+        p=SCRYPT_P,
+        dklen=HASH_BYTES,
+    )
+    return "$".join(
+        (
+            _SCHEME,
+            str(SCRYPT_N),
+            str(SCRYPT_R),
+            str(SCRYPT_P),
+            base64.b64encode(salt).decode(),
+            base64.b64encode(derived).decode(),
+        )
+    )
+
+
+def verify_password(password: str, stored_hash: str) -> bool:
+    """
+    Check a plaintext password against a hash produced by hash_password().
+
+    The cost parameters and salt are read from the stored hash itself, and the
+    derived keys are compared in constant time.
+
+    Args:
+        password (str): The plaintext password to check.
+        stored_hash (str): The encoded hash read from the members table.
+
+    Returns:
+        bool: True if the password matches, False if it does not or if
+              stored_hash is not a recognised scrypt hash.
+    """
+    try:
+        scheme, n, r, p, salt, expected = stored_hash.split("$")
+        if scheme != _SCHEME:
+            return False
+        expected_bytes = base64.b64decode(expected)
+        derived = hashlib.scrypt(
+            password.encode(),
+            salt=base64.b64decode(salt),
+            n=int(n),
+            r=int(r),
+            p=int(p),
+            dklen=len(expected_bytes),
+        )
+    except ValueError:
+        return False
+
+    return hmac.compare_digest(derived, expected_bytes)
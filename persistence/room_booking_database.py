@@ -16,10 +16,12 @@ Classes:
 
 Dependencies:
     - datetime.date, datetime.time: Date and time handling for bookings
-    - typing.List, typing.Union: Type annotations for method signatures
+    - typing.Iterator, typing.List, typing.Union: Type annotations for method signatures
+    - json: Booking export serialization
+    - logging: Operation status and error reporting (module logger)
     - mysql.connector: MySQL database connectivity and error handling
-    - mysql.connector.cursor_cext.CMySQLCursor: MySQL cursor type annotations
-    - persistence.DatabaseManager: Core database connection management
+    - persistence.DatabaseManager: Pooled database connections (get_conn)
+    - persistence.models.BookingColumns: Columnar booking list results
 
 Key Features:
     - Room availability searching with advanced criteria
@@ -61,13 +63,185 @@ Security Features:
     - Comprehensive error handling prevents data corruption
 """
 
+import json
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, time
-from typing import List, Union
+from itertools import chain, islice
+from time import monotonic
+from typing import Iterable, Iterator, List, Union
 
 import mysql.connector
-from mysql.connector.cursor_cext import CMySQLCursor
 
-from persistence import DatabaseManager
+from persistence import DatabaseManager, db_operation
+
+from .availability_index import AvailabilityIndex
+from .models import BookingColumns, BookingRecordDict, BookingRow
+
+logger = logging.getLogger(__name__)
+
+# Status prefixes for log messages, defined once instead of in every literal.
+_OK = "\u2705"
+_FAIL = "\u274c"
+_INFO = "\U0001f4cb"
+
+# make_booking and cancel_booking write single member_bookings rows keyed by
+# booking id and never re-read them in the same transaction, so they do not
+# need REPEATABLE READ's next-key (gap) locks. Running them under READ
+# COMMITTED shortens lock hold times and avoids gap-lock deadlocks and lock
+# wait timeouts between concurrent bookers.
+BOOKING_ISOLATION_LEVEL = "READ COMMITTED"
+
+# cancel_booking procedure p_status value for a successful cancellation.
+CANCEL_STATUS_CANCELLED = 0
+
+# Seconds a search_room() result is reused for identical criteria. Successful
+# bookings and cancellations through the same instance clear the cache at once.
+SEARCH_CACHE_TTL = 10.0
+
+# Most search_room() results kept per instance; the least recently used entry
+# is evicted first, so a long-running process cannot grow the cache unbounded.
+SEARCH_CACHE_MAXSIZE = 1024
+
+# Seconds before the in-memory AvailabilityIndex is rebuilt from the database,
+# which also picks up cancellations made by other processes.
+AVAILABILITY_INDEX_MAX_AGE = 60.0
+
+# Post-filter for a "fully booked" index answer: the same free-room condition
+# the search_room procedure counts, evaluated against the live tables.
+_FREE_ROOM_EXISTS_QUERY = """
+    select exists (
+        select 1
+        from rooms r
+        where r.room_type = %s
+            and r.status = 'AVAILABLE'
+            and r.id not in (
+                select b.room_id
+                from bookings b
+                where b.booked_date = %s
+                    and b.booked_time = %s
+                    and b.payment_status != 'CANCELLED'
+            )
+    )
+"""
+
+_AVAILABILITY_ROOMS_QUERY = """
+    select id, room_type from rooms where status = 'AVAILABLE'
+"""
+_AVAILABILITY_BOOKINGS_QUERY = """
+    select room_id, booked_date, booked_time
+    from bookings
+    where booked_date >= curdate() and payment_status != 'CANCELLED'
+"""
+
+# Keyset-paginated form of _SHOW_BOOKINGS_QUERY for iter_bookings(). MySQL
+# range-scans the booking_summary primary key; the booking id is selected
+# first only to seed the next page.
+_BOOKINGS_PAGE_QUERY = """
+    select
+        booking_id,
+        room_id,
+        room_type,
+        datetime_of_booking,
+        member_id,
+        payment_status
+    from booking_summary
+    where booking_id > %s
+    order by booking_id
+    limit %s
+"""
+
+# make_booking CALLs sent per multi-statement request by book_rooms(); keeps
+# each request comfortably below the server's default max_allowed_packet.
+BOOK_ROOMS_CHUNK_SIZE = 200
+
+# cancel_booking ends with a (status, message) result row. The booking id is
+# always bound as a parameter, so the statement text is the same for every
+# cancellation.
+_CANCEL_BOOKING_STATEMENT = "CALL cancel_booking(%s, @status, @message)"
+
+# search_room ends with a (status, message) result row after its room rows.
+_SEARCH_ROOM_STATEMENT = "CALL search_room(%s, %s, %s, @status, @message)"
+
+# Rows fetched per iter_bookings() page.
+BOOKINGS_PAGE_SIZE = 500
+
+# make_booking ends with a (booking_id, status, message) result row, so one
+# CALL returns its outcome. book_rooms() repeats the statement once per
+# request in a single multi-statement round trip.
+_BOOK_ROOM_STATEMENT = (
+    "CALL make_booking(%s, %s, %s, %s, @booking_id, @status, @message)"
+)
+
+# The booking listing reads booking_summary, a table kept pre-joined with the
+# room type by triggers on bookings (see final_sql_project_sports_booking.sql),
+# so a listing is a primary key scan instead of a bookings/rooms join per call.
+_SHOW_BOOKINGS_QUERY = """
+    select
+        room_id,
+        room_type,
+        datetime_of_booking,
+        member_id,
+        payment_status
+    from booking_summary
+    order by booking_id
+"""
+
+# Columns of booking_summary that show_bookings_raw() may project, in the
+# default (full row) order. Field names are checked against this whitelist
+# before being formatted into the select list.
+BOOKING_FIELDS = (
+    "room_id",
+    "room_type",
+    "datetime_of_booking",
+    "member_id",
+    "payment_status",
+)
+
+
+class BookingError(Exception):
+    """
+    A booking procedure reported a business failure (not a database error).
+
+    Raised inside a DatabaseManager.transaction() block so the transaction is
+    rolled back, then caught by the calling method and reported. Only used
+    where this layer owns the transaction (cancel_booking()); make_booking
+    manages its own, so book_room() simply returns False.
+
+    Attributes:
+        status: The procedure's status value, or None if it returned no result.
+        message (str): The procedure's message.
+    """
+
+    def __init__(self, status, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _call_procedure(cursor, call_statement: str, params: tuple) -> List[List[tuple]]:
+    """
+    Run CALL statement(s) and return the rows of every result set produced.
+
+    A CALL that returns result sets sends several results back (the sets plus
+    a final status), so it is executed with multi=True and drained here.
+
+    Args:
+        cursor: Cursor on the connection that should run the procedure(s).
+        call_statement (str): One or more ";"-separated statements with %s
+            placeholders.
+        params (tuple): Values for the %s placeholders.
+
+    Returns:
+        List[List[tuple]]: The rows of each result set, in order.
+    """
+    return [
+        result.fetchall()
+        for result in cursor.execute(call_statement, params, multi=True)
+        if result.with_rows
+    ]
 
 
 class RoomBookingDatabase:
@@ -84,9 +258,11 @@ class RoomBookingDatabase:
     handles connection management, error handling, and provides detailed feedback
     for all operations.
 
-    Attributes:
-        db (DatabaseManager): Database connection manager instance providing
-                            MySQL connectivity and query execution capabilities.
+    Connection Handling:
+        Instances hold no connection of their own. Every method checks a
+        connection out of the shared pool with DatabaseManager.get_conn() and
+        returns it before the method returns, so an instance is cheap to
+        create and concurrent bookers do not serialize on one connection.
 
     Design Patterns:
         - Repository Pattern: Encapsulates data access logic
@@ -131,62 +307,99 @@ class RoomBookingDatabase:
         - Data validation errors
         - Transaction rollback scenarios
 
+        search_room(), book_room() and cancel_booking() share the db_operation
+        decorator, which logs database errors, returns the method's failure
+        value and transparently retries InnoDB deadlock victims.
+
+    Prepared Statements:
+        Methods deliberately do not keep a long-lived prepared cursor
+        (cursor(prepared=True)). A server-side prepared statement belongs to
+        one connection, while every call here borrows whichever pooled
+        connection is free, and the pool resets each connection's session
+        (pool_reset_session), which deallocates its prepared statements, when
+        it is returned. Preparing per checkout would add a round trip instead
+        of saving one. search_room, make_booking and cancel_booking are single
+        CALLs returning their outcome as a result row, so there is little
+        statement parsing left for preparation to save. Code that repeats one
+        plain statement on a dedicated connection can use
+        DatabaseManager.fetch_all(), which caches a prepared cursor per
+        statement.
+
+    Search Cache:
+        search_room() results are cached per instance for SEARCH_CACHE_TTL
+        seconds, keyed by (room_type, book_date, book_time) with the room type
+        case-folded (the rooms table compares room types case-insensitively).
+        At most SEARCH_CACHE_MAXSIZE results are kept, evicting the least
+        recently used. book_room() and cancel_booking() clear the cache after
+        every successful write.
+        Bookings made by other processes become visible once the entry expires.
+
+    Availability Index:
+        Before calling the search_room procedure, searches consult an
+        in-memory AvailabilityIndex of booked start times. If the index shows
+        every room of the requested type as booked for the slot, that answer
+        is only a candidate: it is confirmed with a single existence query
+        against the live tables (_FREE_ROOM_EXISTS_QUERY) before the search
+        returns [] without a procedure call. If the query finds a free room
+        (e.g. another process cancelled a booking), the index is invalidated
+        and the procedure runs as usual. The index is rebuilt every
+        AVAILABILITY_INDEX_MAX_AGE seconds and after any cancellation, and is
+        updated in place after each successful booking.
+
     Thread Safety:
-        This class is not thread-safe. Create separate instances for
-        concurrent operations or implement proper locking mechanisms.
+        Each call uses its own pooled connection, so one instance can be
+        shared between threads as long as the pool (DatabaseManager.POOL_SIZE)
+        is large enough for the number of concurrent calls. The search cache
+        is guarded by a lock.
     """
 
     def __init__(self):
         """
         Initialize a new RoomBookingDatabase instance.
 
-        Creates a new database interface instance with an active DatabaseManager
-        connection. The initialization establishes the necessary database connection
-        for all subsequent room booking operations.
-
-        The constructor delegates connection management to the DatabaseManager class,
-        ensuring consistent database connectivity patterns across the application.
-
-        Initialization Process:
-            1. Creates a DatabaseManager instance
-            2. Establishes MySQL database connection
-            3. Prepares the instance for booking operations
-
-        Raises:
-            mysql.connector.Error: If database connection fails during initialization
-            ConnectionError: If the MySQL server is not accessible
-            Exception: For any other initialization errors
-
-        Example:
-            >>> # Initialize room booking database
-            >>> try:
-            ...     room_db = RoomBookingDatabase()
-            ...     print("Room booking database initialized successfully")
-            ... except mysql.connector.Error as e:
-            ...     print(f"Database connection failed: {e}")
-
-        Note:
-            The database connection remains active for the lifetime of the instance.
-            Proper cleanup is handled by the DatabaseManager's destructor.
+        No database connection is opened here; each method borrows one from
+        the shared pool. The instance only sets up its search_room() cache.
         """
-        self.db = DatabaseManager()
-
-    def show_bookings(self) -> CMySQLCursor:
+        self._search_cache: OrderedDict[tuple, tuple[float, List[tuple]]] = (
+            OrderedDict()
+        )
+        self._search_cache_lock = threading.Lock()
+        self._availability = AvailabilityIndex()
+
+    def _clear_search_cache(self) -> None:
+        """Drop every cached search_room() result after a committed write."""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+
+    def _refresh_availability_index(self) -> None:
+        """Rebuild the availability index if it is unloaded or too old."""
+        if not self._availability.is_stale(AVAILABILITY_INDEX_MAX_AGE):
+            return
+        with DatabaseManager.get_conn() as conn, conn.cursor() as cursor:
+            cursor.execute(_AVAILABILITY_ROOMS_QUERY)
+            rooms = cursor.fetchall()
+            cursor.execute(_AVAILABILITY_BOOKINGS_QUERY)
+            bookings = cursor.fetchall()
+        self._availability.load(rooms, bookings)
+
+    def show_bookings(self) -> List[BookingRow]:
         """
-        Retrieve all booking records from the member_bookings table.
+        Retrieve all booking records from the booking_summary table.
 
         This method fetches comprehensive booking information including room details,
         booking timestamps, member information, and payment status. It provides a
         complete view of all bookings in the system for administrative and reporting
         purposes.
 
-        The method executes a SELECT query that joins booking data with room
-        information to provide a comprehensive booking overview. All records
-        are returned regardless of booking status or date.
+        The method reads booking_summary, where booking data is kept already
+        joined with room information, to provide a comprehensive booking
+        overview. All records are returned regardless of booking status or date.
 
         Returns:
-            CMySQLCursor: Database cursor containing all booking records.
-                         Each record includes:
+            List[BookingRow]: All booking records, fully read before the pooled
+                         connection is returned. BookingRow is a named tuple,
+                         so records unpack like plain tuples and also offer
+                         attribute access. Each record includes:
                          - room_id (str): Unique identifier of the booked room
                          - room_type (str): Type of facility (gymnasium, tennis_court, etc.)
                          - datetime_of_booking (datetime): When the booking was made
@@ -195,8 +408,9 @@ class RoomBookingDatabase:
 
         Query Structure:
             Retrieves fields: room_id, room_type, datetime_of_booking, member_id, payment_status
-            From table: member_bookings
-            Ordering: Natural database order (typically by booking_id)
+            From table: booking_summary (trigger-maintained copy of the
+                member_bookings view)
+            Ordering: booking_id (primary key order)
 
         Usage Context:
             - Administrative booking overview
@@ -219,8 +433,8 @@ class RoomBookingDatabase:
             ...     print("-" * 30)
 
         Performance Notes:
-            - Returns all records without pagination
-            - Consider adding LIMIT clause for large datasets
+            - Returns all records without pagination; use iter_bookings() to
+              stream large tables page by page
             - Index on datetime_of_booking recommended for sorting
 
         Security:
@@ -229,21 +443,170 @@ class RoomBookingDatabase:
             - Returns sensitive member information - ensure proper access control
 
         Note:
-            This method returns raw database results. Consider implementing
-            pagination or filtering for systems with large numbers of bookings.
+            This method returns raw database results. For systems with large
+            numbers of bookings, iter_bookings() streams the same rows with
+            keyset pagination.
+        """
+        return list(map(BookingRow._make, self.show_bookings_raw()))
+
+    def show_bookings_raw(
+        self, fields: tuple[str, ...] = BOOKING_FIELDS, raw: bool = False
+    ) -> List[tuple]:
+        """
+        Retrieve all booking records as the plain tuples returned by the cursor.
+
+        Same query and row layout as show_bookings(), without wrapping each
+        row in a BookingRow, for callers that only index into the rows.
+        Callers that need only some columns (e.g. an admin list showing
+        room_id, datetime_of_booking and member_id) can pass a narrower
+        fields tuple, so the unused columns are never sent over the wire.
+
+        With raw=True the rows come from a raw cursor: the connector skips
+        its per-column type conversion and every value is returned as the
+        undecoded bytes sent by the server (e.g. datetime_of_booking as
+        bytearray(b"2025-08-25 14:30:00")). On large dumps most of the read
+        time otherwise goes into building datetime objects, so callers that
+        only print or forward the values can decode just the columns they
+        use, when they use them.
+
+        Args:
+            fields (tuple[str, ...]): Columns to select, in row order. Each
+                must be one of BOOKING_FIELDS. Defaults to all of them.
+            raw (bool): Return undecoded bytes instead of Python values.
+                Defaults to False.
+
+        Returns:
+            List[tuple]: One tuple per booking with the requested columns.
+                         By default (room_id, room_type, datetime_of_booking,
+                         member_id, payment_status).
+
+        Raises:
+            ValueError: If fields is empty or names a column that is not in
+                BOOKING_FIELDS.
+
+        Example:
+            >>> rows = room_db.show_bookings_raw(
+            ...     fields=("room_id", "datetime_of_booking", "member_id")
+            ... )
+            >>> for room_id, booked_at, member_id in room_db.show_bookings_raw(
+            ...     fields=("room_id", "datetime_of_booking", "member_id"), raw=True
+            ... ):
+            ...     print(room_id.decode(), booked_at.decode(), member_id.decode())
+        """
+        if fields == BOOKING_FIELDS:
+            query = _SHOW_BOOKINGS_QUERY
+        else:
+            unknown = set(fields) - set(BOOKING_FIELDS)
+            if not fields or unknown:
+                raise ValueError(f"Invalid booking fields: {sorted(unknown)}")
+            query = (
+                f"select {', '.join(fields)} from booking_summary order by booking_id"
+            )
+
+        with DatabaseManager.get_conn() as conn, conn.cursor(raw=raw) as cursor:
+            cursor.execute(query)
+            return cursor.fetchall()
+
+    def show_bookings_columnar(self) -> BookingColumns:
+        """
+        Retrieve all booking records as a column-oriented BookingColumns buffer.
+
+        Runs the same query as show_bookings() but transposes the rows into one
+        list per column, which is cheaper to keep around for large result sets
+        and serializes straight to JSON with BookingColumns.to_json().
+
+        Returns:
+            BookingColumns: room_ids, room_types, booked_at, member_ids and
+                            payment_statuses of every booking.
+
+        Example:
+            >>> columns = room_db.show_bookings_columnar()
+            >>> print(f"{len(columns)} bookings")
+            >>> payload = columns.to_json()
+        """
+        return BookingColumns.from_rows(self.show_bookings_raw())
+
+    def iter_bookings(
+        self, after_id: int = 0, page_size: int = BOOKINGS_PAGE_SIZE
+    ) -> Iterator[tuple]:
+        """
+        Stream booking records page by page using keyset pagination.
+
+        Each page is one "where id > last_id order by id limit page_size"
+        query, so peak memory is bounded by page_size instead of the size of
+        the bookings table, and later pages cost the same as the first. A
+        pooled connection is borrowed per page and returned before the page's
+        rows are yielded, so a slow consumer does not hold a connection.
+
+        Args:
+            after_id (int): Only bookings with a larger id are returned.
+                Defaults to 0 (all bookings).
+            page_size (int): Rows fetched per query. Defaults to
+                BOOKINGS_PAGE_SIZE.
+
+        Yields:
+            tuple: (room_id, room_type, datetime_of_booking, member_id,
+                   payment_status), the same row shape as show_bookings(),
+                   in booking id order.
+
+        Example:
+            >>> for room_id, room_type, booked_at, member_id, payment in (
+            ...     room_db.iter_bookings()
+            ... ):
+            ...     print(f"{room_id} booked by {member_id} at {booked_at}")
+        """
+        last_id = after_id
+        while True:
+            with DatabaseManager.get_conn() as conn, conn.cursor() as cursor:
+                cursor.execute(_BOOKINGS_PAGE_QUERY, (last_id, page_size))
+                page = cursor.fetchall()
+
+            for row in page:
+                yield row[1:]
+
+            if len(page) < page_size:
+                return
+            last_id = page[-1][0]
+
+    def iter_booking_records(self) -> Iterator[BookingRecordDict]:
+        """
+        Stream all booking records as plain dicts.
+
+        Rows come from iter_bookings() and are converted to BookingRecordDict
+        one at a time, so neither the full table nor any model instance is
+        held in memory.
+
+        Yields:
+            BookingRecordDict: One dict per booking, with the booking time as
+                               an ISO 8601 string.
+        """
+        for room_id, room_type, booked_at, member_id, payment_status in (
+            self.iter_bookings()
+        ):
+            yield {
+                "room_id": room_id,
+                "room_type": room_type,
+                "datetime_of_booking": booked_at.isoformat(),
+                "member_id": member_id,
+                "payment_status": payment_status,
+            }
+
+    def export_bookings_json(self) -> bytes:
         """
-        query = """
-            select
-                room_id,
-                room_type,
-                datetime_of_booking,
-                member_id,
-                payment_status
-            from member_bookings
+        Serialize all bookings to a JSON array without building Booking objects.
+
+        Returns:
+            bytes: UTF-8 encoded JSON array of BookingRecordDict objects.
+
+        Example:
+            >>> with open("bookings.json", "wb") as export_file:
+            ...     export_file.write(room_db.export_bookings_json())
         """
-        results = self.db.execute(query)
-        return results.fetchall()
+        return json.dumps(
+            list(self.iter_booking_records()), separators=(",", ":")
+        ).encode()
 
+    @db_operation([])
     def search_room(
         self, room_type: str, book_date: date, book_time: time
     ) -> List[tuple]:
@@ -325,56 +688,128 @@ class RoomBookingDatabase:
             - Minimal data transfer with targeted results
 
         Status Messages:
-            The method displays status messages including:
+            The method logs status messages (INFO/ERROR) including:
             - "📋 Search Status: Found X available rooms"
             - "📋 Search Status: No rooms available for specified criteria"
-            - "❌ Database Error during room search: [error details]"
+            - "RoomBookingDatabase.search_room failed: [error details]"
+
+        Caching:
+            Results are reused for SEARCH_CACHE_TTL seconds for the same
+            criteria (see the class docstring); a cache hit prints no status
+            message. Failed searches are never cached.
 
         Note:
             The stored procedure may have output parameters that provide additional
             status information. These are captured and displayed to the user.
         """
-        try:
-            cursor = self.db.connection.cursor()
-
-            # Use callproc which properly handles stored procedures with result sets
-            cursor.callproc("search_room", [room_type, book_date, book_time, "", ""])
+        key = (room_type.casefold(), book_date, book_time)
+        with self._search_cache_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None and cached[0] > monotonic():
+                self._search_cache.move_to_end(key)
+                return list(cached[1])
+
+        # Database errors propagate to db_operation, so they are not cached
+        rooms = self._search_room_uncached(room_type, book_date, book_time)
+
+        with self._search_cache_lock:
+            self._search_cache[key] = (monotonic() + SEARCH_CACHE_TTL, rooms)
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > SEARCH_CACHE_MAXSIZE:
+                self._search_cache.popitem(last=False)
+        return list(rooms)
+
+    def show_bookings_and_search_room(
+        self, room_type: str, book_date: date, book_time: time
+    ) -> tuple[List[BookingRow], List[tuple]]:
+        """
+        Run show_bookings() and search_room() concurrently.
 
-            # Get the search results from stored_results
-            room_data = []
-            for result in cursor.stored_results():
-                room_data = result.fetchall()
+        Each call borrows its own pooled connection, so the two queries are in
+        flight at the same time and the wall time is that of the slower one
+        instead of their sum. Use this for screens that show the booking list
+        next to a room search.
 
-            cursor.close()
+        Args:
+            room_type (str): Passed to search_room().
+            book_date (date): Passed to search_room().
+            book_time (time): Passed to search_room().
 
-            # Get output parameters with a separate cursor
-            output_cursor = self.db.connection.cursor()
-            output_cursor.execute("SELECT @status, @message")
-            status_result = output_cursor.fetchone()
+        Returns:
+            tuple: (bookings, rooms), the results of show_bookings() and
+                   search_room() respectively.
 
-            if status_result:
-                status, message = status_result
-                if status:  # Only print if status is not None
-                    print(f"📋 Search Status: {message}")
+        Raises:
+            mysql.connector.Error: If show_bookings() fails (search_room()
+                reports its own database errors by returning []).
 
-                    if status == "SUCCESS":
-                        output_cursor.close()
-                        return room_data
-                    else:
-                        output_cursor.close()
-                        return []
+        Example:
+            >>> bookings, rooms = room_db.show_bookings_and_search_room(
+            ...     "Tennis Court", date(2025, 8, 25), time(14, 0)
+            ... )
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            bookings = executor.submit(self.show_bookings)
+            rooms = executor.submit(self.search_room, room_type, book_date, book_time)
+            return bookings.result(), rooms.result()
 
-            output_cursor.close()
-            # If no proper status, return the data we found
-            return room_data
+    def _free_room_exists(
+        self, room_type: str, book_date: date, book_time: time
+    ) -> bool:
+        """
+        Confirm a "fully booked" index answer against the live tables.
 
-        except mysql.connector.Error as err:
-            print(f"❌ Database Error during room search: {err}")
-            return []
-        except Exception as e:
-            print(f"❌ Unexpected Error during room search: {e}")
+        The index can lag behind writes made by other processes or directly in
+        SQL, so it only nominates a slot as fully booked. If the database
+        still has a free room, the index is stale and is invalidated so the
+        next search rebuilds it.
+        """
+        with DatabaseManager.get_conn() as conn, conn.cursor() as cursor:
+            cursor.execute(_FREE_ROOM_EXISTS_QUERY, (room_type, book_date, book_time))
+            (free_room_exists,) = cursor.fetchone()
+        if free_room_exists:
+            self._availability.invalidate()
+        return bool(free_room_exists)
+
+    def _search_room_uncached(
+        self, room_type: str, book_date: date, book_time: time
+    ) -> List[tuple]:
+        """Run the search_room procedure and print its status message."""
+        # Past dates are left to the procedure, which reports INVALID_DATE
+        if book_date >= date.today():
+            self._refresh_availability_index()
+            if not self._availability.has_free_room(
+                room_type, book_date, book_time
+            ) and not self._free_room_exists(room_type, book_date, book_time):
+                logger.info(
+                    "%s Search Status: No available rooms found for %s on %s at %s",
+                    _INFO,
+                    room_type,
+                    book_date,
+                    book_time,
+                )
+                return []
+
+        with DatabaseManager.get_conn() as conn, conn.cursor() as cursor:
+            # The procedure returns its room rows (if any) followed by a
+            # (status, message) row, so the CALL alone is one round trip
+            result_sets = _call_procedure(
+                cursor, _SEARCH_ROOM_STATEMENT, (room_type, book_date, book_time)
+            )
+        if not result_sets:
             return []
 
+        *room_sets, status_rows = result_sets
+        room_data = room_sets[-1] if room_sets else []
+        status, message = status_rows[0]
+        if status:  # Only print if status is not None
+            logger.info("%s Search Status: %s", _INFO, message)
+            return room_data if status == "SUCCESS" else []
+
+        # If no proper status, return the data we found
+        return room_data
+
+    @db_operation(False)
     def book_room(
         self, room_id: str, book_date: date, book_time: time, user_id: str
     ) -> bool:
@@ -400,8 +835,8 @@ class RoomBookingDatabase:
 
         Returns:
             bool: True if booking was created successfully, False otherwise.
-                 Success includes proper database commit and booking ID generation.
-                 Failure triggers automatic transaction rollback.
+                 Success means make_booking committed the booking and generated
+                 its booking ID; on failure make_booking has rolled back.
 
         Stored Procedure Workflow:
             1. Validates all input parameters for format and business rules
@@ -414,10 +849,12 @@ class RoomBookingDatabase:
             8. Returns success status with detailed confirmation message
 
         Transaction Management:
-            - Automatic transaction commit on successful booking creation
-            - Automatic rollback on any validation failure or error
-            - Ensures database consistency and prevents partial bookings
-            - Handles concurrent booking attempts safely
+            - make_booking owns the transaction: it starts, commits and rolls
+              back its own work, so this method only borrows a pooled
+              connection (DatabaseManager.get_conn) at
+              BOOKING_ISOLATION_LEVEL and issues no commit or rollback
+            - Non-SUCCESS statuses are reported by returning False; there is
+              nothing left for this layer to roll back
 
         Error Handling:
             Comprehensive error handling covers:
@@ -463,7 +900,7 @@ class RoomBookingDatabase:
             - "❌ Booking failed: Room not available at specified time"
             - "❌ Booking failed: Member not found or inactive"
             - "❌ Booking failed: Invalid room ID"
-            - "❌ Database Error: [technical error details]"
+            - "RoomBookingDatabase.book_room failed: [technical error details]"
 
         Business Rules Enforced:
             - No double booking of the same room/time slot
@@ -476,7 +913,7 @@ class RoomBookingDatabase:
         Security Features:
             - Parameterized stored procedure calls prevent SQL injection
             - Member authentication verification
-            - Transaction atomicity ensures data consistency
+            - make_booking's own transaction keeps each booking all-or-nothing
             - Proper error handling prevents information leakage
 
         Performance Considerations:
@@ -489,54 +926,112 @@ class RoomBookingDatabase:
             The booking ID is automatically generated by the stored procedure
             and can be used for future booking modifications or cancellations.
         """
-        try:
-            # Call enhanced stored procedure with output parameters
-            cursor = self.db.connection.cursor()
-
-            # Prepare the call with proper output variables
-            call_query = """
-                CALL make_booking(%s, %s, %s, %s, @booking_id, @status, @message)
-            """
-
-            # Execute the procedure call
-            cursor.execute(call_query, (room_id, book_date, book_time, user_id))
-
-            # Retrieve the output parameter values
-            cursor.execute("SELECT @booking_id, @status, @message")
-            result = cursor.fetchone()
-
-            if result:
-                booking_id, status, message = result
-
-                if status == "SUCCESS":
-                    print(f"✅ {message}")
-                    print(f"📋 Booking ID: {booking_id}")
-                    self.db.connection.commit()
-                    cursor.close()
-                    return True
-                else:
-                    print(f"❌ Booking failed: {message}")
-                    print(f"📋 Status: {status}")
-                    self.db.connection.rollback()
-                    cursor.close()
-                    return False
-            else:
-                print("❌ Unexpected error: No result from stored procedure")
-                self.db.connection.rollback()
-                cursor.close()
-                return False
-
-        except mysql.connector.Error as err:
-            print(f"❌ Database Error: {err}")
-            if self.db.connection:
-                self.db.connection.rollback()
+        # get_conn(), not transaction(): make_booking starts, commits and rolls
+        # back its own transaction, so there is nothing for this layer to own
+        with DatabaseManager.get_conn(
+            isolation_level=BOOKING_ISOLATION_LEVEL
+        ) as conn, conn.cursor() as cursor:
+            # The procedure returns its outcome as a result row, so the CALL
+            # alone is one round trip
+            result_sets = _call_procedure(
+                cursor,
+                _BOOK_ROOM_STATEMENT,
+                (room_id, book_date, book_time, user_id),
+            )
+
+        if not result_sets or not result_sets[-1]:
+            logger.error("%s Unexpected error: No result from stored procedure", _FAIL)
             return False
-        except Exception as e:
-            print(f"❌ Unexpected Error: {e}")
-            if self.db.connection:
-                self.db.connection.rollback()
+
+        booking_id, status, message = result_sets[-1][0]
+        if status != "SUCCESS":
+            logger.info("%s Booking failed: %s", _FAIL, message)
+            logger.info("%s Status: %s", _INFO, status)
             return False
 
+        logger.info("%s %s", _OK, message)
+        logger.info("%s Booking ID: %s", _INFO, booking_id)
+        DatabaseManager.mark_data_changed()
+        self._clear_search_cache()
+        self._availability.mark_booked(room_id, book_date, book_time)
+        return True
+
+    def book_rooms(
+        self, requests: Iterable[tuple[str, date, time, str]]
+    ) -> List[tuple]:
+        """
+        Create several bookings in one database round trip per chunk.
+
+        Every request is sent as a make_booking CALL, which returns its
+        outcome as a result row, and up to BOOK_ROOMS_CHUNK_SIZE of them go to
+        the server together as one multi-statement request on a single pooled
+        connection. Booking N requests therefore costs
+        ceil(N / BOOK_ROOMS_CHUNK_SIZE) round trips instead of N, while a
+        large import never builds a request beyond the server's
+        max_allowed_packet.
+
+        make_booking commits (or rolls back) its own transaction, so each
+        request succeeds or fails on its own, exactly as with book_room();
+        there is no all-or-nothing batch. For the same reason this method is
+        not wrapped in db_operation: rerunning the batch after a deadlock
+        would repeat requests that were already booked.
+
+        Args:
+            requests: (room_id, book_date, book_time, user_id) tuples, in the
+                same form as the book_room() arguments.
+
+        Returns:
+            List[tuple]: One (booking_id, status, message) tuple per processed
+                         request, in request order. If a database error stops
+                         the batch, the requests processed before it are
+                         returned and the rest were not booked.
+
+        Example:
+            >>> results = room_db.book_rooms([
+            ...     ("T1", date(2025, 8, 25), time(14, 0), "alice"),
+            ...     ("T2", date(2025, 8, 25), time(14, 0), "bob"),
+            ... ])
+            >>> booked = [r for r in results if r[1] == "SUCCESS"]
+        """
+        requests = list(requests)
+        if not requests:
+            return []
+
+        results = []
+        try:
+            # get_conn(), not transaction(): make_booking commits every call
+            # itself, so there is no batch transaction to commit or roll back
+            with DatabaseManager.get_conn(
+                isolation_level=BOOKING_ISOLATION_LEVEL
+            ) as conn, conn.cursor() as cursor:
+                for start in range(0, len(requests), BOOK_ROOMS_CHUNK_SIZE):
+                    chunk = requests[start : start + BOOK_ROOMS_CHUNK_SIZE]
+                    statement = "; ".join([_BOOK_ROOM_STATEMENT] * len(chunk))
+                    for result in cursor.execute(
+                        statement, tuple(chain.from_iterable(chunk)), multi=True
+                    ):
+                        if result.with_rows:
+                            results.append(result.fetchone())
+
+        except mysql.connector.Error as err:
+            logger.error("%s Database Error: %s", _FAIL, err)
+
+        booked = [
+            request
+            for request, (_, status, _) in zip(requests, results)
+            if status == "SUCCESS"
+        ]
+        if booked:
+            DatabaseManager.mark_data_changed()
+            self._clear_search_cache()
+            for room_id, book_date, book_time, _ in booked:
+                self._availability.mark_booked(room_id, book_date, book_time)
+        logger.info(
+            "%s Batch Booking: %d of %d booked", _INFO, len(booked), len(requests)
+        )
+        return results
+
+    @db_operation(False)
     def cancel_booking(self, booking_id: int) -> bool:
         """
         Cancel an existing booking using the enhanced cancel_booking stored procedure.
@@ -559,6 +1054,9 @@ class RoomBookingDatabase:
                  Success includes proper database commit and status updates.
                  Failure triggers automatic transaction rollback.
 
+        Raises:
+            ValueError: If booking_id cannot be converted to an int.
+
         Stored Procedure Workflow:
             1. Validates booking_id exists in the member_bookings table
             2. Checks booking status (cannot cancel already cancelled bookings)
@@ -626,13 +1124,16 @@ class RoomBookingDatabase:
             - "❌ Cancellation failed: Booking not found"
             - "❌ Cancellation failed: Too late to cancel (policy violation)"
             - "❌ Cancellation failed: Booking already cancelled"
-            - "❌ Database Error: [technical error details]"
+            - "RoomBookingDatabase.cancel_booking failed: [error details]"
 
         Status Detection:
-            The method determines success/failure by analyzing the message content:
-            - Success: Message contains "cancelled" but not "error"
-            - Failure: Message contains error indicators or policy violations
-            - Handles various message formats from stored procedure
+            The stored procedure reports a numeric status (see
+            CANCEL_STATUS_CANCELLED and the cancel_booking procedure):
+            - 0: Booking cancelled
+            - 1: Too late, on or after the booked date
+            - 2: Booking already cancelled or paid
+            - 3: Booking not found
+            The message is only displayed, never parsed.
 
         Refund Processing:
             - Cancellation may trigger refund processing flags
@@ -657,52 +1158,39 @@ class RoomBookingDatabase:
             with 'cancelled' status for historical tracking and reporting purposes.
             The time slot becomes available for new bookings.
         """
+        # Reject non-integer ids before they reach the server; the id is
+        # always sent as a bound parameter, never formatted into the SQL text
+        booking_id = int(booking_id)
         try:
-            cursor = self.db.connection.cursor()
-
-            # Prepare the call with proper output variables
-            call_query = """
-                CALL cancel_booking(%s, @message)
-            """
-
-            # Execute the procedure call
-            cursor.execute(call_query, (booking_id,))
-
-            # Retrieve the output parameter value
-            cursor.execute("SELECT @message")
-            result = cursor.fetchone()
-
-            if result:
-                message = result[0]
-
-                # Check if cancellation was successful based on message content
-                if "cancelled" in message.lower() and "error" not in message.lower():
-                    print(f"✅ {message}")
-                    self.db.connection.commit()
-                    cursor.close()
-                    return True
-                else:
-                    print(f"❌ Cancellation failed: {message}")
-                    self.db.connection.rollback()
-                    cursor.close()
-                    return False
+            with DatabaseManager.transaction(
+                isolation_level=BOOKING_ISOLATION_LEVEL
+            ) as conn, conn.cursor() as cursor:
+                # The procedure returns its outcome as a result row, so the
+                # CALL alone is one round trip
+                result_sets = _call_procedure(
+                    cursor, _CANCEL_BOOKING_STATEMENT, (booking_id,)
+                )
+                if not result_sets or not result_sets[-1]:
+                    raise BookingError(None, "No result from stored procedure")
+
+                status, message = result_sets[-1][0]
+                if status != CANCEL_STATUS_CANCELLED:
+                    raise BookingError(status, message)
+
+        except BookingError as err:
+            if err.status is None:
+                logger.error("%s Unexpected error: %s", _FAIL, err.message)
             else:
-                print("❌ Unexpected error: No result from stored procedure")
-                self.db.connection.rollback()
-                cursor.close()
-                return False
-
-        except mysql.connector.Error as err:
-            print(f"❌ Database Error: {err}")
-            if self.db.connection:
-                self.db.connection.rollback()
-            return False
-        except Exception as e:
-            print(f"❌ Unexpected Error: {e}")
-            if self.db.connection:
-                self.db.connection.rollback()
+                logger.info("%s Cancellation failed: %s", _FAIL, err.message)
             return False
 
+        logger.info("%s %s", _OK, message)
+        DatabaseManager.mark_data_changed()
+        self._clear_search_cache()
+        # Only the booking id is known here, so rebuild on next search
+        self._availability.invalidate()
+        return True
+
 
 if __name__ == "__main__":
     """
@@ -733,6 +1221,7 @@ if __name__ == "__main__":
     Example Operations:
         The following examples demonstrate comprehensive room booking workflows:
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     room_booking = RoomBookingDatabase()
 
     print("🏟️ Sports Complex Room Booking Database Demo")
@@ -741,9 +1230,10 @@ if __name__ == "__main__":
     # Example 1: Display all current bookings
     print("\n📋 Current Bookings:")
     try:
-        bookings = room_booking.show_bookings()
+        # Stream only the first page instead of reading every booking
+        bookings = list(islice(room_booking.iter_bookings(page_size=5), 5))
         if bookings:
-            for booking in bookings[:5]:  # Show first 5 bookings
+            for booking in bookings:  # Show first 5 bookings
                 room_id, room_type, booking_time, member_id, payment = booking
                 print(f"• {room_type} ({room_id}) - Member: {member_id}")
                 print(f"  Booked: {booking_time} | Payment: {payment}")
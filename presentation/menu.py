@@ -1,3 +1,6 @@
+import sys
+from types import MappingProxyType
+
 from business_logic import (
     ListMembersCommand,
     AddMembersCommand,
@@ -35,6 +38,65 @@ menu_options = {
     "Q": ("Quit", {"Q": Option("Quit Application", QuitCommand(), success_message="")}),
 }
 
+# Shared "X" entry of every submenu; sub_menu() recognises it by identity.
+BACK_OPTION = Option("Back to Main Menu", None)
+
+# Banner and divider lines shared by every menu screen
+SEP_EQ = "=" * 50
+SEP_DASH = "-" * 50
+
+
+def _menu_screen(title: str, entries, heading: str | None = None) -> str:
+    """Return a full menu screen: banner, one line per (key, name), divider."""
+    lines = ["", SEP_EQ, title, SEP_EQ]
+    if heading:
+        lines.append(heading)
+    lines.extend(f"  {key}: {name}" for key, name in entries)
+    lines.append(SEP_DASH)
+    return "\n".join(lines) + "\n"
+
+
+# Menu screens never change after import, so each is rendered once and
+# redrawn with a single write.
+MAIN_MENU_SCREEN = _menu_screen(
+    "🏟️  SPORTS COMPLEX BOOKING SYSTEM",
+    ((key, menu_name) for key, (menu_name, _) in menu_options.items()),
+    heading="Main Menu:",
+)
+
+
+class MenuSection:
+    """
+    A submenu's choices together with its prerendered screen.
+
+    The choices are the submenu's options plus BACK_OPTION, held in a
+    read-only view so they cannot drift from the rendered screen; lookups
+    and membership tests still go straight to the underlying dict.
+
+    Attributes:
+        options (MappingProxyType): Choice key -> Option, including "X".
+        rendered (str): The full screen, ready for a single write.
+    """
+
+    __slots__ = ("options", "rendered")
+
+    def __init__(self, menu_name: str, options: dict):
+        self.options = MappingProxyType({**options, "X": BACK_OPTION})
+        self.rendered = _menu_screen(
+            f"📋 {menu_name}",
+            ((key, option.name) for key, option in self.options.items()),
+        )
+
+
+# One section per submenu in menu_options, built once at import. Keyed by the
+# identity of the submenu's options dict, so a caller passing a different dict
+# under the same title never gets these choices. The dicts live as long as the
+# module, so their ids cannot be reused by other objects.
+SUBMENU_SECTIONS = {
+    id(sub_options): MenuSection(menu_name, sub_options)
+    for menu_name, sub_options in menu_options.values()
+}
+
 
 def main_menu():
     """
@@ -55,22 +117,13 @@ def main_menu():
     All menu actions follow the Command pattern for architectural consistency.
     """
     while True:
-        print("\n" + "=" * 50)
-        print("🏟️  SPORTS COMPLEX BOOKING SYSTEM")
-        print("=" * 50)
-        print("Main Menu:")
-        for key, (menu_name, _) in menu_options.items():
-            print(f"  {key}: {menu_name}")
-        print("-" * 50)
-
-        # Create choices dictionary for get_options_choice
-        main_choices = {
-            key: (menu_name, sub_options)
-            for key, (menu_name, sub_options) in menu_options.items()
-        }
+        # Emit the prerendered screen with one write; the prompt written by
+        # get_options_choice flushes screen and prompt together
+        sys.stdout.write(MAIN_MENU_SCREEN)
 
-        # Use get_options_choice for automatic validation
-        choice_result = get_options_choice(main_choices)
+        # menu_options already maps each key to its (menu_name, sub_options)
+        # choice; get_options_choice validates the input against it
+        choice_result = get_options_choice(menu_options)
         menu_name, sub_options = choice_result
         sub_menu(menu_name, sub_options)
 
@@ -100,22 +153,20 @@ def sub_menu(menu_name: str, options: dict):
         - Catches and displays any exceptions during command execution
         - Prompts user to continue after errors or successful operations
     """
-    while True:
-        print(f"\n" + "=" * 50)
-        print(f"📋 {menu_name}")
-        print("=" * 50)
-        for key, option in options.items():
-            print(f"  {key}: {option.name}")
-        print("  X: Back to Main Menu")
-        print("-" * 50)
+    # Prebuilt choices and screen including the back option (built here only
+    # for option dicts that are not part of menu_options)
+    section = SUBMENU_SECTIONS.get(id(options)) or MenuSection(menu_name, options)
+    submenu_choices = section.options
+    screen = section.rendered
 
-        # Create choices dictionary including back option
-        submenu_choices = {**options, "X": Option("Back to Main Menu", None)}
+    while True:
+        # Emit the whole screen with one write, flushed with the prompt
+        sys.stdout.write(screen)
 
         # Use get_options_choice for automatic validation
         selected_option = get_options_choice(submenu_choices)
 
-        if selected_option.name == "Back to Main Menu":
+        if selected_option is BACK_OPTION:
             break
         else:
             try:
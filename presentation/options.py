@@ -79,7 +79,9 @@ class Option:
                                            to prepare input data. Defaults to None.
             success_message (str, optional): Template string for success messages.
                                            Uses {result} placeholder for command result.
-                                           Defaults to "{result}".
+                                           Defaults to "{result}". An empty
+                                           string prints nothing on success.
+                                           The template is resolved once here.
 
         Raises:
             TypeError: If command doesn't implement execute() method.
@@ -97,6 +99,22 @@ class Option:
         self.command = command
         self.prep_call = prep_call
         self.success_message = success_message
+        # Pick the execution path once; options without prep_call run the
+        # command's bound execute() directly
+        self._run = self._prepare_and_execute if prep_call else getattr(
+            command, "execute", None
+        )
+        # Resolve the message template once: "" prints nothing, the default
+        # "{result}" is just str(), anything else is a small closure that
+        # formats the template with result=...
+        if not success_message:
+            self._format_success = None
+        elif success_message == "{result}":
+            self._format_success = str
+        else:
+            self._format_success = lambda result: success_message.format(
+                result=result
+            )
 
     def choose(self) -> None:
         """
@@ -134,11 +152,15 @@ class Option:
             >>> option.choose()
             # Calls list_cmd.execute() directly, prints result
         """
-        data = self.prep_call() if self.prep_call else None
-        success, result = self.command.execute(data) if data else self.command.execute()
+        success, result = self._run()
 
-        if success:
-            print(self.success_message.format(result=result))
+        if success and self._format_success:
+            print(self._format_success(result))
+
+    def _prepare_and_execute(self):
+        """Run prep_call and execute the command with its data, if any."""
+        data = self.prep_call()
+        return self.command.execute(data) if data else self.command.execute()
 
     def __str__(self) -> str:
         """
@@ -33,13 +33,39 @@ Functions:
     format_table_generic: Generic table formatter with column-specific formatters.
     format_member_table: Specialized formatter for member data.
     format_booking_table: Specialized formatter for room booking data.
+    write_table: Write a formatted table to stdout in a single call.
 
 Author: Sports Booking System Development Team
 Date: August 2025
 Version: 1.0
 """
 
-from typing import List, Tuple, Any, Optional, Dict, Callable
+import os
+import sys
+from datetime import datetime
+from functools import lru_cache
+from itertools import zip_longest
+from typing import List, Tuple, Any, Optional, Dict, Callable, TextIO
+
+
+@lru_cache(maxsize=64)
+def _table_frame(
+    headers: Tuple[str, ...], widths: Tuple[int, ...]
+) -> Tuple[str, str, str]:
+    """
+    Build the fixed parts of a table for one schema and set of column widths.
+
+    The specialised tables always use the same headers and their column widths
+    rarely change between listings, so the row template, header line and
+    separator are joined once per (headers, widths) and reused afterwards.
+
+    Returns:
+        Tuple[str, str, str]: (row_template, header_line, separator), where
+            row_template is a "%-Ns | %-Ns ..." template for full-width rows.
+    """
+    row_template = " | ".join(f"%-{width}s" for width in widths)
+    separator = "-+-".join("-" * width for width in widths)
+    return row_template, row_template % headers, separator
 
 
 class TableFormatter:
@@ -148,8 +174,9 @@ class TableFormatter:
         if not data:
             return "No data to display."
 
-        # Calculate column widths
-        column_widths = self._calculate_column_widths(data)
+        # Stringify every cell once; widths and rows both reuse these strings
+        str_rows = [[str(cell) for cell in row] for row in data]
+        column_widths = self._calculate_column_widths(str_rows)
 
         # Build the table
         lines = []
@@ -161,22 +188,25 @@ class TableFormatter:
             lines.append(title.center(total_width))
             lines.append("=" * total_width)
 
-        # Add header
-        header_line = " | ".join(
-            header.ljust(column_widths[i]) for i, header in enumerate(self.headers)
+        # Row template, header and separator are shared per schema and widths
+        column_count = len(column_widths)
+        row_template, header_line, separator = _table_frame(
+            tuple(self.headers), tuple(column_widths)
         )
-        lines.append(header_line)
 
-        # Add separator
-        separator = "-+-".join("-" * width for width in column_widths)
+        # Add header and separator
+        lines.append(header_line)
         lines.append(separator)
 
         # Add data rows
-        for row in data:
-            row_line = " | ".join(
-                str(cell).ljust(column_widths[i]) for i, cell in enumerate(row)
+        lines.extend(
+            row_template % tuple(row)
+            if len(row) == column_count
+            else " | ".join(
+                cell.ljust(width) for cell, width in zip(row, column_widths)
             )
-            lines.append(row_line)
+            for row in str_rows
+        )
 
         # Add bottom separator and summary
         lines.append(separator)
@@ -184,7 +214,7 @@ class TableFormatter:
 
         return "\n".join(lines)
 
-    def _calculate_column_widths(self, data: List[Tuple[Any, ...]]) -> List[int]:
+    def _calculate_column_widths(self, data: List[List[str]]) -> List[int]:
         """
         Calculate optimal column widths based on content and headers.
 
@@ -194,8 +224,9 @@ class TableFormatter:
         the longest content in each column.
 
         Args:
-            data (List[Tuple[Any, ...]]): The data rows to analyze for width calculation.
-                Each element will be converted to string to measure its display width.
+            data (List[List[str]]): The already stringified data rows to analyze
+                for width calculation. format_table converts every cell once and
+                passes the result here, so the same strings are measured and printed.
 
         Returns:
             List[int]: A list of integers representing the minimum width needed for
@@ -203,22 +234,22 @@ class TableFormatter:
 
         Note:
             - Starts with header lengths as minimum widths
-            - Iterates through all data rows to find maximum content width per column
-            - Handles data type conversion to string for width measurement
+            - Transposes the rows into columns (zip_longest) and measures each
+              column with map/max, so the per-cell work runs in C
+            - Expects cells already converted to strings by format_table
             - Gracefully handles rows with fewer columns than headers
 
         Example:
-            For headers ["Name", "Age"] and data [("Alice", 25), ("Bob", 30)]:
+            For headers ["Name", "Age"] and data [["Alice", "25"], ["Bob", "30"]]:
             Returns [5, 3] (max of "Alice"/4 and "Name"/4 = 5, max of "25"/2 and "Age"/3 = 3)
         """
-        widths = [len(header) for header in self.headers]
-
-        for row in data:
-            for i, cell in enumerate(row):
-                if i < len(widths):
-                    widths[i] = max(widths[i], len(str(cell)))
-
-        return widths
+        header_count = len(self.headers)
+        columns = list(zip_longest(*data, fillvalue=""))[:header_count]
+        columns += [()] * (header_count - len(columns))
+        return [
+            max(len(header), max(map(len, column), default=0))
+            for header, column in zip(self.headers, columns)
+        ]
 
 
 def format_table_generic(
@@ -283,38 +314,112 @@ def format_table_generic(
     if not data:
         return f"\n{title}\n{'=' * len(title)}\nNo data to display.\n"
 
-    # Apply column formatters if provided
+    # Apply column formatters if provided, resolving each column's formatter
+    # once instead of looking it up again for every cell
     if column_formatters:
-        formatted_data = []
-        for row in data:
-            new_row = []
-            for i, cell in enumerate(row):
-                formatter = column_formatters.get(i, str)
-                new_row.append(formatter(cell))
-            formatted_data.append(tuple(new_row))
-        data = formatted_data
-
-    formatter = TableFormatter(headers)
+        formatters = tuple(column_formatters.get(i, str) for i in range(len(headers)))
+        data = [
+            tuple(format_cell(cell) for format_cell, cell in zip(formatters, row))
+            for row in data
+        ]
+
+    formatter = _get_formatter(tuple(headers))
     return formatter.format_table(data, title)
 
 
+@lru_cache(maxsize=8)
+def _get_formatter(headers: Tuple[str, ...]) -> TableFormatter:
+    """Return a shared TableFormatter per header tuple, validating it only once."""
+    return TableFormatter(list(headers))
+
+
+# Number of distinct (rows, title) renderings kept per specialised table
+TABLE_CACHE_MAXSIZE = 16
+
+
+def _render_cached(render: Callable, data: List[Tuple], title: str) -> str:
+    """
+    Render a table through an lru_cache'd renderer when the rows allow it.
+
+    Listings are often re-rendered from identical data (e.g. "View All Rooms"
+    selected repeatedly with no booking in between), so the specialised
+    formatters cache their output keyed by the rows and title. Rows that
+    cannot be hashed (lists, dicts) bypass the cache and are rendered directly.
+    """
+    rows = tuple(data)
+    try:
+        hash(rows)
+    except TypeError:
+        return render.__wrapped__(rows, title)
+    return render(rows, title)
+
+
+@lru_cache(maxsize=TABLE_CACHE_MAXSIZE)
+def _member_table(rows: Tuple[Tuple, ...], title: str) -> str:
+    """Render the member table; cached by format_member_table."""
+    return format_table_generic(
+        rows,
+        ["Username", "Email", "Balance", "Member Since"],
+        title,
+        {
+            2: lambda x: f"${float(x):.2f}",  # Format balance as currency
+            3: lambda x: datetime.fromtimestamp(x).strftime("%Y-%m-%d"),
+        },
+    )
+
+
+def _fmt_dt(value: Any) -> str:
+    """Format a booking datetime as YYYY-MM-DD HH:MM, or str() anything else."""
+    try:
+        return value.strftime("%Y-%m-%d %H:%M")
+    except AttributeError:
+        return str(value)
+
+
+# Payment status labels indexed by "is the status PAID?" (False -> 0, True -> 1)
+_PAYMENT_STATUS_LABELS = ("❌ UNPAID", "✅ PAID")
+
+
+def _fmt_status(value: Any) -> str:
+    """Format a payment status with its emoji indicator, case-insensitively."""
+    return _PAYMENT_STATUS_LABELS[str(value).upper() == "PAID"]
+
+
+# Column formatters for the booking table, built once at import
+_BOOKING_FMTS: Dict[int, Callable] = {2: _fmt_dt, 4: _fmt_status}
+
+
+@lru_cache(maxsize=TABLE_CACHE_MAXSIZE)
+def _booking_table(rows: Tuple[Tuple, ...], title: str) -> str:
+    """Render the booking table; cached by format_booking_table."""
+    return format_table_generic(
+        rows,
+        ["Room ID", "Room Type", "Booking DateTime", "Member ID", "Payment Status"],
+        title,
+        _BOOKING_FMTS,
+    )
+
+
 # Convenience functions for specific data types
 def format_member_table(
-    member_data: List[Tuple[str, str, float]], title: str = "🏟️ Sports Complex Members"
+    member_data: List[Tuple[str, str, float, int]],
+    title: str = "🏟️ Sports Complex Members",
 ) -> str:
     """
     Format member data into a professional table with currency formatting.
 
     This specialized formatter is designed specifically for displaying sports complex
-    member information. It automatically formats the balance column as currency and
-    provides a clean, consistent display for member management operations.
+    member information. It automatically formats the balance column as currency,
+    renders the registration epoch as a date, and provides a clean, consistent
+    display for member management operations.
 
     Args:
-        member_data (List[Tuple[str, str, float]]): A list of tuples containing member
-            information. Each tuple should contain:
+        member_data (List[Tuple[str, str, float, int]]): A list of tuples containing
+            member information. Each tuple should contain:
             - str: Username/member identifier
             - str: Email address
             - float: Account balance (will be formatted as currency)
+            - int: Registration time as Unix seconds (formatted as a date)
         title (str, optional): The title to display above the member table.
             Defaults to "🏟️ Sports Complex Members" with emoji for visual appeal.
 
@@ -323,38 +428,36 @@ def format_member_table(
             - Username column (left-aligned)
             - Email column (left-aligned)
             - Balance column (formatted as currency with $ symbol and 2 decimal places)
+            - Member Since column (formatted as YYYY-MM-DD)
             - Professional spacing and separators
             - Total member count at the bottom
 
     Example:
         >>> member_data = [
-        ...     ("john_doe", "john@email.com", 25.50),
-        ...     ("jane_smith", "jane@email.com", 100.00),
-        ...     ("bob_wilson", "bob@longdomain.com", 0.0)
+        ...     ("john_doe", "john@email.com", 25.50, 1756080000),
+        ...     ("jane_smith", "jane@email.com", 100.00, 1755993600),
+        ...     ("bob_wilson", "bob@longdomain.com", 0.0, 1755907200)
         ... ]
         >>> print(format_member_table(member_data))
 
         🏟️ Sports Complex Members
         ===========================
-        Username   | Email              | Balance
-        -----------|--------------------|--------
-        john_doe   | john@email.com     | $25.50
-        jane_smith | jane@email.com     | $100.00
-        bob_wilson | bob@longdomain.com | $0.00
-        -----------|--------------------|--------
+        Username   | Email              | Balance | Member Since
+        -----------|--------------------|---------|-------------
+        john_doe   | john@email.com     | $25.50  | 2025-08-25
+        jane_smith | jane@email.com     | $100.00 | 2025-08-24
+        bob_wilson | bob@longdomain.com | $0.00   | 2025-08-23
+        -----------|--------------------|---------|-------------
         Total records: 3
 
     Note:
         This function is specifically designed for the sports booking system's
         member management features. The balance formatting ensures consistent
-        currency display throughout the application.
+        currency display throughout the application. Results are memoized by
+        rows and title, so repeated listings of unchanged data are not
+        re-formatted.
     """
-    return format_table_generic(
-        member_data,
-        ["Username", "Email", "Balance"],
-        title,
-        {2: lambda x: f"${float(x):.2f}"},  # Format balance as currency
-    )
+    return _render_cached(_member_table, member_data, title)
 
 
 def format_booking_table(
@@ -413,17 +516,47 @@ def format_booking_table(
           for quick visual identification
         - This function is specifically designed for the sports booking system's
           room management and booking display features
+        - Results are memoized by rows and title, so repeated listings of
+          unchanged bookings are not re-formatted
     """
-    return format_table_generic(
-        booking_data,
-        ["Room ID", "Room Type", "Booking DateTime", "Member ID", "Payment Status"],
-        title,
-        {
-            2: lambda x: x.strftime("%Y-%m-%d %H:%M")
-            if hasattr(x, "strftime")
-            else str(x),  # Format datetime
-            4: lambda x: "✅ PAID"
-            if str(x).upper() == "PAID"
-            else "❌ UNPAID",  # Format payment status
-        },
-    )
+    return _render_cached(_booking_table, booking_data, title)
+
+
+def write_table(table: str, stream: Optional[TextIO] = None) -> None:
+    """
+    Write a formatted table, trailing newline included, in a single call.
+
+    Produces exactly what print(table) would, but hands the whole table and
+    its line ending to one write call instead of print's separate writes for
+    the text and the end string.
+
+    When writing to sys.stdout and it exposes a binary buffer, the table is
+    encoded once with stdout's own encoding, error handler and line endings
+    and written straight to sys.stdout.buffer, skipping the text wrapper.
+    Pending text output is flushed first so the table cannot overtake earlier
+    print() calls. Streams without a buffer (e.g. a StringIO under test, or an
+    explicit stream argument) receive a plain text write.
+
+    Args:
+        table (str): A formatted table, e.g. from format_member_table().
+        stream (Optional[TextIO], optional): Text stream to write to.
+            Defaults to sys.stdout, looked up at call time so redirected or
+            captured output is honoured.
+
+    Example:
+        >>> write_table(format_member_table(members))
+    """
+    text = table + "\n"
+    if stream is None:
+        stream = sys.stdout
+        buffer = getattr(stream, "buffer", None)
+        if buffer is not None:
+            if os.linesep != "\n":
+                text = text.replace("\n", os.linesep)
+            stream.flush()
+            buffer.write(
+                text.encode(stream.encoding or "utf-8", stream.errors or "strict")
+            )
+            buffer.flush()
+            return
+    stream.write(text)
@@ -15,7 +15,6 @@ Functions:
 
 Dependencies:
     - typing.Any: For flexible return type annotations
-    - presentation.utils.option_choice_is_valid: Validation utility function
 
 Example:
     >>> # Collect required user input
@@ -30,21 +29,50 @@ Example:
     >>> choice()  # Execute selected function
 """
 
+import string
+import sys
 from typing import Any
 
-from presentation.utils import option_choice_is_valid
+
+# ASCII-only upcasing for menu keys; str.translate with this table skips
+# str.upper()'s full Unicode case mapping, and menu keys are ASCII letters.
+_UPCASE_TABLE = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+# Marks a missing key in get_options_choice; option values may be falsy
+_NO_CHOICE = object()
+
+
+def _read_line(prompt: str) -> str:
+    """
+    Write prompt and read one line from stdin, without the trailing newline.
+
+    A leaner input(): one write and one flush for the prompt, then a plain
+    readline, skipping input()'s extra stderr/stdout flushing per call.
+
+    Raises:
+        EOFError: If stdin is exhausted, as input() would.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
 
 
 def get_user_input(label: str, required: bool = True) -> str:
-    value = input(f"{label}: ") or None
+    prompt = f"{label}: "
+    value = _read_line(prompt) or None
     while required and not value:
-        value = input(f"{label}: ") or None
+        value = _read_line(prompt) or None
     return value
 
 
 def get_options_choice(options: dict) -> Any:
-    choice = input("Choose an option: ").upper()
-    while not option_choice_is_valid(choice, options):
+    # One dict probe per attempt validates the key and fetches its option
+    while True:
+        choice = _read_line("Choose an option: ").translate(_UPCASE_TABLE)
+        selected = options.get(choice, _NO_CHOICE)
+        if selected is not _NO_CHOICE:
+            return selected
         print("Invalid choice!")
-        choice = input("Choose an option: ").upper()
-    return options[choice]
@@ -15,7 +15,8 @@ Functions:
     print_options: Displays menu options in a formatted, user-friendly manner.
 
 Dependencies:
-    - os: For cross-platform system command execution
+    - os: For the one-time Windows console setup at import
+    - sys: For writing the clear-screen escape sequence to stdout
 
 Example:
     >>> from utils import clear_screen, print_options
@@ -28,45 +29,47 @@ Example:
 """
 
 import os
+import sys
+
+# ANSI "erase display" followed by "cursor home"
+_CLEAR = "\x1b[2J\x1b[H"
+
+# Windows consoles only interpret ANSI sequences once virtual terminal
+# processing is on; an empty os.system() call enables it for this process.
+# Done once here so clear_screen() never starts a shell.
+if os.name == "nt":
+    os.system("")
 
 
 def clear_screen() -> None:
     """
     Clear the terminal/console screen in a cross-platform compatible manner.
 
-    This function automatically detects the operating system and executes the
-    appropriate system command to clear the screen. It provides a consistent
-    way to refresh the display across different platforms without requiring
-    platform-specific code in the calling functions.
+    This function writes the ANSI escape sequence that erases the display and
+    moves the cursor home, then flushes stdout. It provides a consistent way to
+    refresh the display across different platforms without requiring
+    platform-specific code in the calling functions, and without starting a
+    shell on every call.
 
     Platform Support:
-        - Windows (nt): Uses 'cls' command
-        - Unix/Linux/macOS (posix): Uses 'clear' command
-        - Other platforms: Defaults to 'clear' command
+        - Unix/Linux/macOS terminals: ANSI sequences are supported natively
+        - Windows (nt): Virtual terminal processing is enabled once when this
+          module is imported, after which the same sequence is honoured
 
     Returns:
         None: This function performs a side effect (clearing screen) and
               returns nothing.
 
-    Raises:
-        OSError: May be raised if the system command fails to execute,
-                though this is rare in normal terminal environments.
-
     Example:
         >>> clear_screen()  # Screen is cleared regardless of OS
 
     Note:
-        This function uses os.system() which executes a shell command.
-        While generally safe for this specific use case, be aware that
-        it's executing system commands. The commands used ('cls', 'clear')
-        are standard system utilities available on their respective platforms.
-
-        For applications requiring higher security, consider using alternative
-        methods like ANSI escape sequences, though they may not work in all
-        terminal environments.
+        Earlier versions ran os.system("cls"/"clear"), forking a shell on every
+        redraw. The escape sequence is a single write; terminals without ANSI
+        support (rare today) will show it as literal characters instead.
     """
-    clear = "cls" if os.name == "nt" else "clear"
-    os.system(clear)
+    sys.stdout.write(_CLEAR)
+    sys.stdout.flush()
 
 
 def option_choice_is_valid(choice: str, options: dict) -> bool:
@@ -108,6 +111,9 @@ def option_choice_is_valid(choice: str, options: dict) -> bool:
           associated option value.
         - Works with any hashable key type, though string keys are most common
           in menu systems.
+        - The check is a single hash lookup against the dict's own keys, so
+          it is already O(1) per retry; caching a set of valid keys would
+          only add a copy of the keys and a cache lookup.
 
     Common Usage:
         Used in menu validation loops to ensure user input corresponds to a
@@ -172,10 +178,13 @@ def print_options(options: dict) -> None:
           will be used for display.
         - The function does not add any additional formatting like borders, colors,
           or spacing beyond the basic (key) value format.
+        - All lines are joined first and written with a single sys.stdout.write()
+          call rather than one print() per option.
 
     Common Usage:
         Used in menu systems throughout the sports booking application to display
         available choices to users in a consistent, readable format.
     """
-    for shortcut, option in options.items():
-        print(f"({shortcut}) {option}")
+    sys.stdout.write(
+        "".join(f"({shortcut}) {option}\n" for shortcut, option in options.items())
+    )
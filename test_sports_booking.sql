@@ -294,6 +294,45 @@ CALL _t();
 DROP PROCEDURE IF EXISTS _t;
 
 
+-- ============================================================
+-- SECTION 6A: update_member
+-- ============================================================
+
+-- Setup
+CALL insert_new_member('test_upd1', 'OldPass1!', 'test_upd1@example.com');
+
+
+-- 6A.1 Update password and email together
+CALL update_member('test_upd1', 'NewPass2!', 'updated_upd1@example.com');
+CALL assert_eq('update_member', '6A.1 Password updated in combined call',
+    'NewPass2!', (SELECT password FROM members WHERE id = 'test_upd1'));
+CALL assert_eq('update_member', '6A.1 Email updated in combined call',
+    'updated_upd1@example.com', (SELECT email FROM members WHERE id = 'test_upd1'));
+
+
+-- 6A.2 NULL keeps the current value
+CALL update_member('test_upd1', NULL, 'again_upd1@example.com');
+CALL assert_eq('update_member', '6A.2 NULL password leaves password unchanged',
+    'NewPass2!', (SELECT password FROM members WHERE id = 'test_upd1'));
+CALL assert_eq('update_member', '6A.2 Email updated when password is NULL',
+    'again_upd1@example.com', (SELECT email FROM members WHERE id = 'test_upd1'));
+
+
+-- 6A.3 Update of a non-existent member raises an error
+DROP PROCEDURE IF EXISTS _t;
+DELIMITER $$
+CREATE PROCEDURE _t()
+BEGIN
+    DECLARE v_err INT DEFAULT 0;
+    DECLARE CONTINUE HANDLER FOR SQLEXCEPTION SET v_err = 1;
+    CALL update_member('test_nobody', 'SomePass1!', NULL);
+    CALL assert_int_eq('update_member', '6A.3 Non-existent member raises error', 1, v_err);
+END$$
+DELIMITER ;
+CALL _t();
+DROP PROCEDURE IF EXISTS _t;
+
+
 -- ============================================================
 -- SECTION 7: make_booking
 -- ============================================================
@@ -363,7 +402,7 @@ CALL assert_eq('update_payment', '8.4 Non-existent booking returns NOT_FOUND', '
 
 -- 8.5 Paying a cancelled booking returns CANCELLED
 CALL make_booking('T2', '2030-07-02', '10:00:00', 'test_pay1', @pay_bk_id2, @s, @m);
-CALL cancel_booking(@pay_bk_id2, @cm);
+CALL cancel_booking(@pay_bk_id2, @can_status, @cm);
 CALL update_payment(@pay_bk_id2, @pay_status, @pay_msg);
 CALL assert_eq('update_payment', '8.5 Cancelled booking returns CANCELLED status', 'CANCELLED', @pay_status);
 
@@ -427,9 +466,11 @@ CALL make_booking('AR', '2030-09-01', '10:00:00', 'test_can1', @can_bk_id1, @s,
 
 
 -- 11.1 Valid cancellation returns success message
-CALL cancel_booking(@can_bk_id1, @can_msg);
+CALL cancel_booking(@can_bk_id1, @can_status, @can_msg);
 CALL assert_eq('cancel_booking', '11.1 Valid cancellation returns success message',
     'Booking Cancelled', @can_msg);
+CALL assert_int_eq('cancel_booking', '11.1 Valid cancellation returns status 0',
+    0, @can_status);
 
 
 -- 11.2 Cancelled booking status is set to CANCELLED
@@ -438,16 +479,18 @@ CALL assert_eq('cancel_booking', '11.2 Booking status set to CANCELLED',
 
 
 -- 11.3 Cancelling an already-cancelled booking returns appropriate message
-CALL cancel_booking(@can_bk_id1, @can_msg);
+CALL cancel_booking(@can_bk_id1, @can_status, @can_msg);
 CALL assert_eq('cancel_booking', '11.3 Re-cancelling returns already cancelled message',
     'Booking has already been cancelled or paid', @can_msg);
+CALL assert_int_eq('cancel_booking', '11.3 Re-cancelling returns status 2',
+    2, @can_status);
 
 
 -- 11.4 Cancelling an already-paid booking returns appropriate message
 CALL insert_new_member('test_can2', 'Pass123!', 'test_can2@example.com');
 CALL make_booking('AR', '2030-09-02', '10:00:00', 'test_can2', @can_bk_id2, @s, @m);
 CALL update_payment(@can_bk_id2, @s, @m);
-CALL cancel_booking(@can_bk_id2, @can_msg);
+CALL cancel_booking(@can_bk_id2, @can_status, @can_msg);
 CALL assert_eq('cancel_booking', '11.4 Cancelling paid booking returns appropriate message',
     'Booking has already been cancelled or paid', @can_msg);
 
@@ -456,7 +499,7 @@ CALL assert_eq('cancel_booking', '11.4 Cancelling paid booking returns appropria
 CALL insert_new_member('test_can3', 'Pass123!', 'test_can3@example.com');
 CALL make_booking('B1', '2030-09-03', '10:00:00', 'test_can3', @can_bk_id3, @s, @m);
 -- payment_due is now 8.00; after cancel with no fine it should be 0.00
-CALL cancel_booking(@can_bk_id3, @can_msg);
+CALL cancel_booking(@can_bk_id3, @can_status, @can_msg);
 CALL assert_decimal_eq('cancel_booking', '11.5 Cancellation reduces payment_due (no fine on 1st)',
     0.00, (SELECT payment_due FROM members WHERE id = 'test_can3'));
 
@@ -465,9 +508,19 @@ CALL assert_decimal_eq('cancel_booking', '11.5 Cancellation reduces payment_due
 -- (make_booking allows today; cancel_booking blocks cancellation on/after the date)
 CALL insert_new_member('test_can4', 'Pass123!', 'test_can4@example.com');
 CALL make_booking('MPF1', CURDATE(), '08:00:00', 'test_can4', @can_bk_id4, @s, @m);
-CALL cancel_booking(@can_bk_id4, @can_msg);
+CALL cancel_booking(@can_bk_id4, @can_status, @can_msg);
 CALL assert_eq('cancel_booking', '11.6 Cancel on booked date returns appropriate message',
     'Cancellation cannot be done on/after the booked date', @can_msg);
+CALL assert_int_eq('cancel_booking', '11.6 Cancel on booked date returns status 1',
+    1, @can_status);
+
+
+-- 11.7 Cancelling a non-existent booking returns status 3
+CALL cancel_booking(-1, @can_status, @can_msg);
+CALL assert_int_eq('cancel_booking', '11.7 Non-existent booking returns status 3',
+    3, @can_status);
+CALL assert_eq('cancel_booking', '11.7 Non-existent booking returns not found message',
+    'Booking not found', @can_msg);
 
 
 -- ============================================================
@@ -500,14 +553,14 @@ SET @fine_bk3 = (SELECT id FROM bookings WHERE member_id = 'test_fine' AND booke
 
 -- 12.1 1st consecutive cancellation: no fine (cancel most recent booking first)
 -- check_cancellation sees: bk3(CANCELLED), bk2(UNPAID) → stops → count = 1 → no fine
-CALL cancel_booking(@fine_bk3, @can_msg);
+CALL cancel_booking(@fine_bk3, @can_status, @can_msg);
 CALL assert_decimal_eq('check_cancellation', '12.1 1st cancellation: no fine, payment_due = 20.00',
     20.00, (SELECT payment_due FROM members WHERE id = 'test_fine'));
 
 
 -- 12.2 2nd consecutive cancellation: still no fine
 -- check_cancellation sees: bk3(CANCELLED), bk2(CANCELLED), bk1(UNPAID) → count = 2 → no fine
-CALL cancel_booking(@fine_bk2, @can_msg);
+CALL cancel_booking(@fine_bk2, @can_status, @can_msg);
 CALL assert_decimal_eq('check_cancellation', '12.2 2nd cancellation: no fine, payment_due = 10.00',
     10.00, (SELECT payment_due FROM members WHERE id = 'test_fine'));
 
@@ -515,7 +568,7 @@ CALL assert_decimal_eq('check_cancellation', '12.2 2nd cancellation: no fine, pa
 -- 12.3 3rd consecutive cancellation: $10 fine is applied
 -- check_cancellation sees: bk3(CANCELLED), bk2(CANCELLED), bk1(CANCELLED) → count = 3 → FINE!
 -- payment_due: 10.00 - 10.00 (cancel) + 10.00 (fine) = 10.00
-CALL cancel_booking(@fine_bk1, @can_msg);
+CALL cancel_booking(@fine_bk1, @can_status, @can_msg);
 CALL assert_decimal_eq('check_cancellation', '12.3 3rd cancellation: $10 fine applied, payment_due = 10.00',
     10.00, (SELECT payment_due FROM members WHERE id = 'test_fine'));
 
@@ -586,7 +639,7 @@ CALL assert_int_eq('booking_audit triggers',
 
 
 -- 14.3 CANCEL detection: cancelling a booking creates a CANCEL audit record (not UPDATE)
-CALL cancel_booking(@aud_bk_id, @can_msg);
+CALL cancel_booking(@aud_bk_id, @can_status, @can_msg);
 CALL assert_int_eq('booking_audit triggers',
     '14.3 Cancel detection: cancellation creates CANCEL audit record',
     1, (SELECT COUNT(*) FROM booking_audit
@@ -602,6 +655,26 @@ CALL assert_int_eq('booking_audit triggers',
         WHERE booking_id = @del_bk_id AND action = 'DELETE'));
 
 
+-- 14.5 booking_summary: a new booking is added to the materialized listing
+CALL make_booking('B2', '2030-12-01', '09:00:00', 'test_aud1', @sum_bk_id, @s, @m);
+CALL assert_eq('booking_summary triggers',
+    '14.5 INSERT trigger: new booking appears in booking_summary with its room type',
+    'Badminton Court', (SELECT room_type FROM booking_summary WHERE booking_id = @sum_bk_id));
+
+
+-- 14.6 booking_summary: cancelling a booking updates its payment status
+CALL cancel_booking(@sum_bk_id, @can_status, @can_msg);
+CALL assert_eq('booking_summary triggers',
+    '14.6 UPDATE trigger: cancellation is reflected in booking_summary',
+    'CANCELLED', (SELECT payment_status FROM booking_summary WHERE booking_id = @sum_bk_id));
+
+
+-- 14.7 booking_summary: deleted bookings are removed from the listing
+CALL assert_int_eq('booking_summary triggers',
+    '14.7 DELETE trigger: deleted booking is removed from booking_summary',
+    0, (SELECT COUNT(*) FROM booking_summary WHERE booking_id = @del_bk_id));
+
+
 
 -- ============================================================
 -- SECTION 15: RESULTS & CLEANUP
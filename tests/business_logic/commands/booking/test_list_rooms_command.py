@@ -22,6 +22,8 @@ from io import StringIO
 
 from business_logic.commands.booking.list_rooms_command import ListRoomCommand
 
+WRITE_TABLE = "business_logic.commands.booking.list_rooms_command.write_table"
+
 
 class TestListRoomCommandExecute(unittest.TestCase):
     """Test cases for ListRoomCommand execute method."""
@@ -43,7 +45,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             success, result = command.execute()
 
         # Assert
@@ -51,7 +53,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         self.assertIsNone(result)
         mock_db.show_bookings.assert_called_once()
         mock_format_table.assert_called_once_with(mock_bookings)
-        mock_print.assert_called_once_with("Formatted Table Output")
+        mock_write_table.assert_called_once_with("Formatted Table Output")
 
     @patch("business_logic.commands.booking.list_rooms_command.format_booking_table")
     @patch("business_logic.commands.booking.list_rooms_command.db")
@@ -66,7 +68,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             success, result = command.execute()
 
         # Assert
@@ -74,7 +76,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         self.assertIsNone(result)
         mock_db.show_bookings.assert_called_once()
         mock_format_table.assert_called_once_with(mock_bookings)
-        mock_print.assert_called_once_with("No bookings found")
+        mock_write_table.assert_called_once_with("No bookings found")
 
     @patch("business_logic.commands.booking.list_rooms_command.format_booking_table")
     @patch("business_logic.commands.booking.list_rooms_command.db")
@@ -89,7 +91,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             success, result = command.execute(data=None)
 
         # Assert
@@ -110,7 +112,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             success, result = command.execute(data={"arbitrary": "data"})
 
         # Assert
@@ -131,14 +133,14 @@ class TestListRoomCommandExecute(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             success, result = command.execute()
 
         # Assert
         self.assertTrue(success)
         self.assertIsNone(result)
         mock_format_table.assert_called_once_with(mock_bookings)
-        mock_print.assert_called_once_with("Single booking table")
+        mock_write_table.assert_called_once_with("Single booking table")
 
     @patch("business_logic.commands.booking.list_rooms_command.format_booking_table")
     @patch("business_logic.commands.booking.list_rooms_command.db")
@@ -155,7 +157,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             success, result = command.execute()
 
         # Assert
@@ -163,7 +165,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         self.assertIsNone(result)
         mock_db.show_bookings.assert_called_once()
         mock_format_table.assert_called_once_with(mock_bookings)
-        mock_print.assert_called_once()
+        mock_write_table.assert_called_once()
 
     @patch("business_logic.commands.booking.list_rooms_command.format_booking_table")
     @patch("business_logic.commands.booking.list_rooms_command.db")
@@ -186,7 +188,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             success, result = command.execute()
 
         # Assert
@@ -212,7 +214,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             success, result = command.execute()
 
         # Assert
@@ -240,7 +242,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             success, result = command.execute()
 
         # Assert
@@ -265,7 +267,7 @@ class TestListRoomCommandExecute(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             success, result = command.execute()
 
         # Assert
@@ -308,14 +310,14 @@ class TestListRoomCommandDatabaseExceptions(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             success, result = command.execute()
 
         # Assert
         self.assertTrue(success)
         self.assertIsNone(result)
         mock_format_table.assert_called_once_with(None)
-        mock_print.assert_called_once_with("Formatted None")
+        mock_write_table.assert_called_once_with("Formatted None")
 
     @patch("business_logic.commands.booking.list_rooms_command.format_booking_table")
     @patch("business_logic.commands.booking.list_rooms_command.db")
@@ -373,13 +375,13 @@ class TestListRoomCommandFormatterExceptions(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             success, result = command.execute()
 
         # Assert
         self.assertTrue(success)
         self.assertIsNone(result)
-        mock_print.assert_called_once_with("")
+        mock_write_table.assert_called_once_with("")
 
     @patch("business_logic.commands.booking.list_rooms_command.format_booking_table")
     @patch("business_logic.commands.booking.list_rooms_command.db")
@@ -394,22 +396,22 @@ class TestListRoomCommandFormatterExceptions(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             success, result = command.execute()
 
         # Assert
         self.assertTrue(success)
         self.assertIsNone(result)
-        mock_print.assert_called_once_with(None)
+        mock_write_table.assert_called_once_with(None)
 
 
-class TestListRoomCommandPrintExceptions(unittest.TestCase):
-    """Test cases for print operation exception handling."""
+class TestListRoomCommandWriteExceptions(unittest.TestCase):
+    """Test cases for table write exception handling."""
 
     @patch("business_logic.commands.booking.list_rooms_command.format_booking_table")
     @patch("business_logic.commands.booking.list_rooms_command.db")
-    def test_execute_print_exception_raised(self, mock_db, mock_format_table):
-        """Test that print exceptions are propagated."""
+    def test_execute_write_exception_raised(self, mock_db, mock_format_table):
+        """Test that write exceptions are propagated."""
 
         # Arrange
         mock_bookings = [(1, "T1", "user1", "2026-02-10", "10:00:00")]
@@ -419,7 +421,7 @@ class TestListRoomCommandPrintExceptions(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act & Assert
-        with patch("builtins.print", side_effect=IOError("Print error")):
+        with patch(WRITE_TABLE, side_effect=IOError("Write error")):
             with self.assertRaises(IOError):
                 command.execute()
 
@@ -440,7 +442,7 @@ class TestListRoomCommandReturnValues(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             result = command.execute()
 
         # Assert
@@ -460,7 +462,7 @@ class TestListRoomCommandReturnValues(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             success, result = command.execute()
 
         # Assert
@@ -480,7 +482,7 @@ class TestListRoomCommandReturnValues(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             success, result = command.execute()
 
         # Assert
@@ -524,7 +526,7 @@ class TestListRoomCommandInstanceCreation(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act & Assert
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             success1, result1 = command.execute()
             success2, result2 = command.execute()
             success3, result3 = command.execute()
@@ -567,7 +569,7 @@ class TestListRoomCommandIntegration(unittest.TestCase):
         mock_format_table.side_effect = track_format_call
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             command.execute()
 
         # Assert
@@ -591,7 +593,7 @@ class TestListRoomCommandIntegration(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             command.execute()
 
         # Assert
@@ -602,8 +604,8 @@ class TestListRoomCommandIntegration(unittest.TestCase):
 
     @patch("business_logic.commands.booking.list_rooms_command.format_booking_table")
     @patch("business_logic.commands.booking.list_rooms_command.db")
-    def test_execute_prints_formatter_output(self, mock_db, mock_format_table):
-        """Test that formatter output is printed to console."""
+    def test_execute_writes_formatter_output(self, mock_db, mock_format_table):
+        """Test that formatter output is written to the console."""
 
         # Arrange
         mock_bookings = [(1, "T1", "user1", "2026-02-10", "10:00:00")]
@@ -614,11 +616,11 @@ class TestListRoomCommandIntegration(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print") as mock_print:
+        with patch(WRITE_TABLE) as mock_write_table:
             command.execute()
 
         # Assert
-        mock_print.assert_called_once_with(expected_output)
+        mock_write_table.assert_called_once_with(expected_output)
 
 
 class TestListRoomCommandEdgeCases(unittest.TestCase):
@@ -639,7 +641,7 @@ class TestListRoomCommandEdgeCases(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             success, result = command.execute()
 
         # Assert
@@ -663,7 +665,7 @@ class TestListRoomCommandEdgeCases(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             success, result = command.execute()
 
         # Assert
@@ -686,7 +688,7 @@ class TestListRoomCommandEdgeCases(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             success, result = command.execute()
 
         # Assert
@@ -709,7 +711,7 @@ class TestListRoomCommandEdgeCases(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             success, result = command.execute()
 
         # Assert
@@ -732,7 +734,7 @@ class TestListRoomCommandEdgeCases(unittest.TestCase):
         command = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             success, result = command.execute()
 
         # Assert
@@ -760,7 +762,7 @@ class TestListRoomCommandThreadSafety(unittest.TestCase):
         command2 = ListRoomCommand()
 
         # Act
-        with patch("builtins.print"):
+        with patch(WRITE_TABLE):
             success1, result1 = command1.execute()
             success2, result2 = command2.execute()
 
@@ -5,8 +5,8 @@ Coverage:
     - Successful listing (happy path)
     - show_members called exactly once
     - Members data forwarded to format_member_table
-    - Formatted output is printed
-    - Empty member list still processed and printed
+    - Formatted output is written with write_table
+    - Empty member list still processed and written
     - Single member (boundary case)
     - Large member list
     - data= parameter always ignored
@@ -106,11 +106,11 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
-    def test_execute_prints_formatted_table(
-        self, mock_print, mock_db, mock_format_table
+    @patch("business_logic.commands.member.list_members_command.write_table")
+    def test_execute_writes_formatted_table(
+        self, mock_write_table, mock_db, mock_format_table
     ):
-        """Test that the formatted table string is printed."""
+        """Test that the formatted table string is written to stdout."""
 
         mock_db.show_members.return_value = [
             ("user1", "Alice", "a@b.com", "2025-01-01")
@@ -119,7 +119,7 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
         ListMembersCommand().execute()
 
-        mock_print.assert_called_once_with("Formatted Output")
+        mock_write_table.assert_called_once_with("Formatted Output")
 
     # ------------------------------------------------------------------
     # Various data scenarios
@@ -127,11 +127,11 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
+    @patch("business_logic.commands.member.list_members_command.write_table")
     def test_execute_with_empty_member_list(
-        self, mock_print, mock_db, mock_format_table
+        self, mock_write_table, mock_db, mock_format_table
     ):
-        """Test that an empty list is passed to formatter and result is printed."""
+        """Test that an empty list is passed to formatter and result is written."""
 
         mock_db.show_members.return_value = []
         mock_format_table.return_value = "No members found"
@@ -141,12 +141,14 @@ class TestListMembersCommandExecute(unittest.TestCase):
         self.assertTrue(success)
         self.assertIsNone(result)
         mock_format_table.assert_called_once_with([])
-        mock_print.assert_called_once_with("No members found")
+        mock_write_table.assert_called_once_with("No members found")
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
-    def test_execute_with_single_member(self, mock_print, mock_db, mock_format_table):
+    @patch("business_logic.commands.member.list_members_command.write_table")
+    def test_execute_with_single_member(
+        self, mock_write_table, mock_db, mock_format_table
+    ):
         """Test execution with exactly one member (boundary case)."""
 
         members = [("only_user", "Solo Member", "solo@example.com", "2025-06-01")]
@@ -158,13 +160,13 @@ class TestListMembersCommandExecute(unittest.TestCase):
         self.assertTrue(success)
         self.assertIsNone(result)
         mock_format_table.assert_called_once_with(members)
-        mock_print.assert_called_once_with("Single member table")
+        mock_write_table.assert_called_once_with("Single member table")
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
+    @patch("business_logic.commands.member.list_members_command.write_table")
     def test_execute_with_large_member_list(
-        self, mock_print, mock_db, mock_format_table
+        self, mock_write_table, mock_db, mock_format_table
     ):
         """Test execution with a large member dataset."""
 
@@ -183,8 +185,10 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
-    def test_execute_with_none_from_db(self, mock_print, mock_db, mock_format_table):
+    @patch("business_logic.commands.member.list_members_command.write_table")
+    def test_execute_with_none_from_db(
+        self, mock_write_table, mock_db, mock_format_table
+    ):
         """Test execution when db.show_members returns None."""
 
         mock_db.show_members.return_value = None
@@ -195,13 +199,13 @@ class TestListMembersCommandExecute(unittest.TestCase):
         self.assertTrue(success)
         self.assertIsNone(result)
         mock_format_table.assert_called_once_with(None)
-        mock_print.assert_called_once_with("None table")
+        mock_write_table.assert_called_once_with("None table")
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
+    @patch("business_logic.commands.member.list_members_command.write_table")
     def test_execute_with_special_characters_in_data(
-        self, mock_print, mock_db, mock_format_table
+        self, mock_write_table, mock_db, mock_format_table
     ):
         """Test execution with special characters in member data."""
 
@@ -224,9 +228,9 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
+    @patch("business_logic.commands.member.list_members_command.write_table")
     def test_execute_data_parameter_ignored_with_dict(
-        self, mock_print, mock_db, mock_format_table
+        self, mock_write_table, mock_db, mock_format_table
     ):
         """Test that passing a dict as data= is silently ignored."""
 
@@ -241,8 +245,10 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
-    def test_execute_data_none_explicit(self, mock_print, mock_db, mock_format_table):
+    @patch("business_logic.commands.member.list_members_command.write_table")
+    def test_execute_data_none_explicit(
+        self, mock_write_table, mock_db, mock_format_table
+    ):
         """Test that execute(data=None) behaves identically to execute()."""
 
         mock_db.show_members.return_value = []
@@ -260,9 +266,9 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
+    @patch("business_logic.commands.member.list_members_command.write_table")
     def test_execute_return_value_is_tuple_of_length_2(
-        self, mock_print, mock_db, mock_format_table
+        self, mock_write_table, mock_db, mock_format_table
     ):
         """Test return value is always a 2-tuple."""
 
@@ -276,9 +282,9 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
+    @patch("business_logic.commands.member.list_members_command.write_table")
     def test_execute_first_element_is_bool_true(
-        self, mock_print, mock_db, mock_format_table
+        self, mock_write_table, mock_db, mock_format_table
     ):
         """Test that the first element is always bool True."""
 
@@ -292,9 +298,9 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
+    @patch("business_logic.commands.member.list_members_command.write_table")
     def test_execute_second_element_is_always_none(
-        self, mock_print, mock_db, mock_format_table
+        self, mock_write_table, mock_db, mock_format_table
     ):
         """Test that the second element is always None."""
 
@@ -311,9 +317,9 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
+    @patch("business_logic.commands.member.list_members_command.write_table")
     def test_execute_formatter_returns_empty_string(
-        self, mock_print, mock_db, mock_format_table
+        self, mock_write_table, mock_db, mock_format_table
     ):
         """Test execution when formatter returns an empty string."""
 
@@ -324,13 +330,13 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
         self.assertTrue(success)
         self.assertIsNone(result)
-        mock_print.assert_called_once_with("")
+        mock_write_table.assert_called_once_with("")
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
+    @patch("business_logic.commands.member.list_members_command.write_table")
     def test_execute_formatter_returns_none(
-        self, mock_print, mock_db, mock_format_table
+        self, mock_write_table, mock_db, mock_format_table
     ):
         """Test execution when formatter returns None."""
 
@@ -341,7 +347,7 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
         self.assertTrue(success)
         self.assertIsNone(result)
-        mock_print.assert_called_once_with(None)
+        mock_write_table.assert_called_once_with(None)
 
     # ------------------------------------------------------------------
     # Exception propagation (no try/except in execute)
@@ -392,9 +398,9 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
+    @patch("business_logic.commands.member.list_members_command.write_table")
     def test_execute_multiple_sequential_calls_same_instance(
-        self, mock_print, mock_db, mock_format_table
+        self, mock_write_table, mock_db, mock_format_table
     ):
         """Test stateless behavior: same instance produces correct results across calls."""
 
@@ -416,7 +422,7 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
         mock_db.reset_mock()
         mock_format_table.reset_mock()
-        mock_print.reset_mock()
+        mock_write_table.reset_mock()
 
         # Second call — different data
         mock_db.show_members.return_value = batch_2
@@ -426,7 +432,7 @@ class TestListMembersCommandExecute(unittest.TestCase):
         self.assertIsNone(result_b)
         mock_db.show_members.assert_called_once()
         mock_format_table.assert_called_once_with(batch_2)
-        mock_print.assert_called_once_with("Table 2")
+        mock_write_table.assert_called_once_with("Table 2")
 
     # ------------------------------------------------------------------
     # order_by interaction with execute
@@ -434,9 +440,9 @@ class TestListMembersCommandExecute(unittest.TestCase):
 
     @patch("business_logic.commands.member.list_members_command.format_member_table")
     @patch("business_logic.commands.member.list_members_command.db")
-    @patch("builtins.print")
+    @patch("business_logic.commands.member.list_members_command.write_table")
     def test_execute_with_different_order_by_still_calls_show_members(
-        self, mock_print, mock_db, mock_format_table
+        self, mock_write_table, mock_db, mock_format_table
     ):
         """Test execution with different order_by values all call show_members."""
 
@@ -72,6 +72,16 @@ class TestMemberInputServiceCollectNewMemberData(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result.id, "user123")
 
+    @patch("business_logic.services.member_input_service.get_user_input")
+    def test_collect_new_member_data_invalid_email(self, mock_input):
+        """Test rejection of a malformed email at account creation."""
+
+        mock_input.side_effect = ["user123", "pass123", "invalidemail"]
+
+        result = MemberInputService.collect_new_member_data()
+
+        self.assertIsNone(result)
+
 
 class TestMemberInputServiceCollectEmailUpdateData(unittest.TestCase):
     """Test cases for collect_member_email_update_data method."""
@@ -0,0 +1,76 @@
+"""
+Test suite for the in-memory room availability index.
+
+This module contains unit tests for persistence.availability_index, covering:
+- Loading rooms and bookings into per-room, per-day bitmaps
+- Free/booked slot checks per room type
+- Incremental booking updates and staleness handling
+- MySQL TIME values returned as timedelta
+"""
+
+import unittest
+from datetime import date, time, timedelta
+
+from persistence.availability_index import AvailabilityIndex
+
+DAY = date(2025, 8, 25)
+ROOMS = [("T1", "Tennis Court"), ("T2", "Tennis Court"), ("AR", "Archery Range")]
+
+
+class TestAvailabilityIndex(unittest.TestCase):
+    """Test cases for AvailabilityIndex."""
+
+    def setUp(self):
+        self.index = AvailabilityIndex()
+        self.index.load(rooms=ROOMS, bookings=[("T1", DAY, time(14, 30))])
+
+    def test_free_room_when_one_room_of_type_is_booked(self):
+        """Test that a partially booked slot still reports a free room."""
+        self.assertTrue(self.index.has_free_room("Tennis Court", DAY, time(14, 30)))
+
+    def test_no_free_room_when_every_room_is_booked(self):
+        """Test that a fully booked slot reports no free room."""
+        self.index.mark_booked("T2", DAY, time(14, 30))
+
+        self.assertFalse(self.index.has_free_room("Tennis Court", DAY, time(14, 30)))
+
+    def test_other_slots_and_days_stay_free(self):
+        """Test that bookings only occupy their exact start time and date."""
+        self.index.mark_booked("AR", DAY, time(9, 0))
+
+        self.assertTrue(self.index.has_free_room("Archery Range", DAY, time(9, 1)))
+        self.assertTrue(
+            self.index.has_free_room("Archery Range", DAY + timedelta(1), time(9, 0))
+        )
+
+    def test_room_type_is_case_insensitive(self):
+        """Test that room types match regardless of case."""
+        self.index.mark_booked("T2", DAY, time(14, 30))
+
+        self.assertFalse(self.index.has_free_room("tennis court", DAY, time(14, 30)))
+
+    def test_unknown_room_type_is_reported_free(self):
+        """Test that unknown room types defer to the database."""
+        self.assertTrue(self.index.has_free_room("Squash Court", DAY, time(10, 0)))
+
+    def test_timedelta_booking_times(self):
+        """Test that TIME columns returned as timedelta are indexed correctly."""
+        self.index.load(
+            rooms=[("AR", "Archery Range")],
+            bookings=[("AR", DAY, timedelta(hours=13))],
+        )
+
+        self.assertFalse(self.index.has_free_room("Archery Range", DAY, time(13, 0)))
+
+    def test_staleness(self):
+        """Test that the index is stale before loading and after invalidation."""
+        self.assertTrue(AvailabilityIndex().is_stale(60.0))
+        self.assertFalse(self.index.is_stale(60.0))
+
+        self.index.invalidate()
+
+        self.assertTrue(self.index.is_stale(60.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,343 @@
+"""
+Test suite for the persistence data models.
+
+This module contains unit tests for persistence.models, covering what the
+former __main__ demonstration block exercised plus the model configuration:
+- Member, SearchRoom and Booking construction
+- JSON serialization and single-pass JSON decoding round trips
+- Frozen instances and rejection of unknown fields
+- Strict date/time fields
+- Bulk list adapters and trusted construction helpers
+- The hand-checked booking payload fast path
+- The columnar BookingColumns buffer
+"""
+
+import unittest
+import json
+from datetime import date, datetime, time
+from unittest.mock import patch
+
+from pydantic import ValidationError
+
+from persistence.models import (
+    BOOKING_LIST_ADAPTER,
+    MEMBER_LIST_ADAPTER,
+    Booking,
+    BookingColumns,
+    BookingRow,
+    Member,
+    SearchRoom,
+    booking_from_payload_fast,
+    cached_type_adapter,
+    decode_booking,
+    decode_bookings,
+    decode_member,
+    decode_members,
+    decode_search_room,
+    make_booking_trusted,
+    make_member_trusted,
+)
+from persistence.models import _trusted_constructor
+
+
+def _member() -> Member:
+    return Member(id="shalow21", password="HelloWorld21", email="shalow21@gmail.com")
+
+
+def _booking() -> Booking:
+    return Booking(
+        room_id="gym_001",
+        book_date=date(2025, 8, 25),
+        book_time=time(14, 30),
+        user="shalow21",
+    )
+
+
+class TestModelConstruction(unittest.TestCase):
+    """Test cases for creating the models with valid data."""
+
+    def test_member_fields(self):
+        """Test that Member stores its fields unchanged."""
+        member = _member()
+
+        self.assertEqual(member.id, "shalow21")
+        self.assertEqual(member.password, "HelloWorld21")
+        self.assertEqual(member.email, "shalow21@gmail.com")
+
+    def test_member_repr_hides_password(self):
+        """Test that the password is not shown in repr()."""
+        self.assertNotIn("HelloWorld21", repr(_member()))
+
+    def test_search_room_fields(self):
+        """Test that SearchRoom keeps date and time objects."""
+        search = SearchRoom(
+            room_type="gymnasium", book_date=date(2025, 8, 25), book_time=time(14, 30)
+        )
+
+        self.assertEqual(search.room_type, "gymnasium")
+        self.assertEqual(search.book_date, date(2025, 8, 25))
+        self.assertEqual(search.book_time, time(14, 30))
+
+    def test_booking_fields(self):
+        """Test that Booking stores its fields unchanged."""
+        booking = _booking()
+
+        self.assertEqual(booking.room_id, "gym_001")
+        self.assertEqual(booking.book_date, date(2025, 8, 25))
+        self.assertEqual(booking.book_time, time(14, 30))
+        self.assertEqual(booking.user, "shalow21")
+
+
+class TestModelConfiguration(unittest.TestCase):
+    """Test cases for the shared frozen/forbid/strict configuration."""
+
+    def test_models_are_frozen(self):
+        """Test that assigning to a field raises a ValidationError."""
+        member = _member()
+
+        with self.assertRaises(ValidationError):
+            member.email = "other@gmail.com"
+
+    def test_frozen_models_are_hashable(self):
+        """Test that equal instances hash equally."""
+        self.assertEqual(hash(_booking()), hash(_booking()))
+
+    def test_extra_fields_are_rejected(self):
+        """Test that unknown fields raise a ValidationError."""
+        with self.assertRaises(ValidationError):
+            Member(id="a", password="b", email="c", payment_due=0)
+
+    def test_strict_date_rejects_string(self):
+        """Test that Python callers must pass a date object."""
+        with self.assertRaises(ValidationError):
+            Booking(
+                room_id="gym_001",
+                book_date="2025-08-25",
+                book_time=time(14, 30),
+                user="shalow21",
+            )
+
+    def test_strict_time_rejects_string(self):
+        """Test that Python callers must pass a time object."""
+        with self.assertRaises(ValidationError):
+            SearchRoom(
+                room_type="gymnasium", book_date=date(2025, 8, 25), book_time="14:30"
+            )
+
+
+class TestJsonRoundTrip(unittest.TestCase):
+    """Test cases for JSON serialization and decoding helpers."""
+
+    def test_member_round_trip(self):
+        """Test that a Member survives dump and decode."""
+        member = _member()
+
+        self.assertEqual(decode_member(member.model_dump_json()), member)
+
+    def test_search_room_round_trip(self):
+        """Test that JSON ISO strings decode into date and time objects."""
+        search = decode_search_room(
+            '{"room_type": "gymnasium", "book_date": "2025-08-25",'
+            ' "book_time": "14:30:00"}'
+        )
+
+        self.assertEqual(search.book_date, date(2025, 8, 25))
+        self.assertEqual(search.book_time, time(14, 30))
+
+    def test_booking_round_trip(self):
+        """Test that a Booking survives dump and decode."""
+        booking = _booking()
+
+        self.assertEqual(decode_booking(booking.model_dump_json()), booking)
+
+    def test_decode_rejects_invalid_json(self):
+        """Test that malformed JSON raises a ValidationError."""
+        with self.assertRaises(ValidationError):
+            decode_member('{"id": "shalow21"')
+
+
+class TestListAdapters(unittest.TestCase):
+    """Test cases for the bulk list adapters."""
+
+    def test_member_list_round_trip(self):
+        """Test dumping and decoding a list of members in one pass."""
+        members = [_member(), Member(id="bob", password="pw", email="b@b.co")]
+
+        raw = MEMBER_LIST_ADAPTER.dump_json(members)
+
+        self.assertEqual(decode_members(raw), members)
+
+    def test_list_adapters_are_shared(self):
+        """Test that the lazily built adapters are cached and reused."""
+        self.assertIs(MEMBER_LIST_ADAPTER, cached_type_adapter(list[Member]))
+        self.assertIs(BOOKING_LIST_ADAPTER, cached_type_adapter(list[Booking]))
+
+    def test_booking_list_round_trip(self):
+        """Test dumping and decoding a list of bookings in one pass."""
+        bookings = [_booking()]
+
+        raw = BOOKING_LIST_ADAPTER.dump_json(bookings)
+
+        self.assertEqual(decode_bookings(raw), bookings)
+
+
+class TestTrustedConstruction(unittest.TestCase):
+    """Test cases for the model_construct based helpers."""
+
+    def test_make_member_trusted(self):
+        """Test that trusted construction matches validated construction."""
+        data = {
+            "id": "shalow21",
+            "password": "HelloWorld21",
+            "email": "shalow21@gmail.com",
+        }
+
+        self.assertEqual(make_member_trusted(data), _member())
+
+    def test_make_booking_trusted(self):
+        """Test that trusted construction matches validated construction."""
+        data = {
+            "room_id": "gym_001",
+            "book_date": date(2025, 8, 25),
+            "book_time": time(14, 30),
+            "user": "shalow21",
+        }
+
+        self.assertEqual(make_booking_trusted(data), _booking())
+
+    def test_generated_constructor_is_cached(self):
+        """Test that each model's trusted constructor is generated once."""
+        make_booking_trusted(_booking().model_dump())
+
+        self.assertIs(_trusted_constructor(Booking), _trusted_constructor(Booking))
+        self.assertIsNot(_trusted_constructor(Booking), _trusted_constructor(Member))
+
+    @patch("persistence.models.TRUSTED_CROSS_CHECK", True)
+    def test_trusted_helpers_validate_with_cross_check(self):
+        """Test that invalid data is caught when TRUSTED_CROSS_CHECK is set."""
+        with self.assertRaises(ValidationError):
+            make_member_trusted({"id": "shalow21"})
+
+    @patch("persistence.models.TRUSTED_CROSS_CHECK", False)
+    def test_trusted_helpers_skip_validation_by_default(self):
+        """Test that the trusted path does not run pydantic validation."""
+        data = _booking().model_dump()
+        data["book_date"] = datetime(2025, 8, 25, 9, 0)
+
+        # Strict Booking validation would reject a datetime for book_date
+        booking = make_booking_trusted(data)
+
+        self.assertEqual(booking.book_date, datetime(2025, 8, 25, 9, 0))
+
+
+class TestBookingFromPayloadFast(unittest.TestCase):
+    """Test cases for booking_from_payload_fast."""
+
+    def _payload(self, **overrides) -> dict:
+        payload = {
+            "room_id": "gym_001",
+            "book_date": date(2025, 8, 25),
+            "book_time": time(14, 30),
+            "user": "shalow21",
+        }
+        payload.update(overrides)
+        return payload
+
+    def test_returns_booking_fields_only(self):
+        """Test that the four fields are returned and extras are dropped."""
+        result = booking_from_payload_fast(self._payload(extra="ignored"))
+
+        self.assertEqual(result, self._payload())
+        self.assertEqual(make_booking_trusted(result), _booking())
+
+    def test_missing_field_raises_key_error(self):
+        """Test that a missing field raises KeyError."""
+        payload = self._payload()
+        del payload["user"]
+
+        with self.assertRaises(KeyError):
+            booking_from_payload_fast(payload)
+
+    def test_room_id_longer_than_column_is_rejected(self):
+        """Test that room_id must fit the VARCHAR(10) column."""
+        with self.assertRaises(ValueError):
+            booking_from_payload_fast(self._payload(room_id="r" * 11))
+
+    def test_string_date_is_rejected(self):
+        """Test that book_date must already be a date object."""
+        with self.assertRaises(ValueError):
+            booking_from_payload_fast(self._payload(book_date="2025-08-25"))
+
+    def test_datetime_date_is_rejected(self):
+        """Test that a datetime is rejected for book_date, as strict Booking does."""
+        with self.assertRaises(ValueError):
+            booking_from_payload_fast(
+                self._payload(book_date=datetime(2025, 8, 25, 14, 30))
+            )
+
+
+class TestBookingColumns(unittest.TestCase):
+    """Test cases for the columnar booking buffer."""
+
+    ROWS = [
+        ("T1", "Tennis Court", datetime(2025, 8, 25, 14, 30), "alice", "Unpaid"),
+        ("AR", "Archery Range", datetime(2025, 8, 26, 9, 0), "bob", "Paid"),
+    ]
+
+    def test_from_rows_transposes_columns(self):
+        """Test that rows become one list per column."""
+        columns = BookingColumns.from_rows(self.ROWS)
+
+        self.assertEqual(columns.room_ids, ["T1", "AR"])
+        self.assertEqual(columns.member_ids, ["alice", "bob"])
+        self.assertEqual(columns.payment_statuses, ["Unpaid", "Paid"])
+        self.assertEqual(len(columns), 2)
+
+    def test_from_rows_empty(self):
+        """Test that no rows give empty columns."""
+        columns = BookingColumns.from_rows([])
+
+        self.assertEqual(len(columns), 0)
+        self.assertEqual(columns.to_json(), b"[]")
+
+    def test_to_json_rows(self):
+        """Test that to_json writes one object per row with ISO timestamps."""
+        decoded = json.loads(BookingColumns.from_rows(self.ROWS).to_json())
+
+        self.assertEqual(
+            decoded[0],
+            {
+                "room_id": "T1",
+                "room_type": "Tennis Court",
+                "datetime_of_booking": "2025-08-25T14:30:00",
+                "member_id": "alice",
+                "payment_status": "Unpaid",
+            },
+        )
+        self.assertEqual(len(decoded), 2)
+
+    def test_count_by_column(self):
+        """Test that count_by tallies the values of one column."""
+        columns = BookingColumns.from_rows(self.ROWS + self.ROWS[:1])
+
+        counts = columns.count_by("payment_statuses")
+
+        self.assertEqual(counts["Unpaid"], 2)
+        self.assertEqual(counts["Paid"], 1)
+
+
+class TestBookingRow(unittest.TestCase):
+    """Test cases for the BookingRow named tuple."""
+
+    def test_row_behaves_like_cursor_tuple(self):
+        """Test that BookingRow equals and unpacks like the raw tuple."""
+        raw = ("T1", "Tennis Court", datetime(2025, 8, 25, 14, 30), "alice", "Unpaid")
+
+        row = BookingRow._make(raw)
+
+        self.assertEqual(row, raw)
+        self.assertEqual(row.member_id, "alice")
+        self.assertEqual(row[4], "Unpaid")
+
+if __name__ == "__main__":
+    unittest.main()
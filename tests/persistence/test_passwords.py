@@ -0,0 +1,69 @@
+"""
+Test suite for the password hashing utilities.
+
+This module contains unit tests for persistence.passwords, covering:
+- Hash format and per-call salting
+- Verification of correct and incorrect passwords
+- Rejection of malformed or foreign hash strings
+"""
+
+import unittest
+
+from persistence.passwords import hash_password, verify_password
+
+
+class TestHashPassword(unittest.TestCase):
+    """Test cases for hash_password function."""
+
+    def test_hash_is_self_describing(self):
+        """Test that the hash records scheme and cost parameters."""
+        scheme, n, r, p, salt, digest = hash_password("Secret123").split("$")
+
+        self.assertEqual(scheme, "scrypt")
+        self.assertEqual((n, r, p), ("16384", "8", "1"))
+        self.assertTrue(salt)
+        self.assertTrue(digest)
+
+    def test_hash_does_not_contain_plaintext(self):
+        """Test that the plaintext password is not stored in the hash."""
+        self.assertNotIn("Secret123", hash_password("Secret123"))
+
+    def test_same_password_hashes_differently(self):
+        """Test that a fresh salt is used for every hash."""
+        self.assertNotEqual(hash_password("Secret123"), hash_password("Secret123"))
+
+    def test_hash_fits_password_column(self):
+        """Test that the encoded hash fits members.password VARCHAR(255)."""
+        self.assertLessEqual(len(hash_password("x" * 200)), 255)
+
+
+class TestVerifyPassword(unittest.TestCase):
+    """Test cases for verify_password function."""
+
+    def test_verify_correct_password(self):
+        """Test that the original password verifies."""
+        stored = hash_password("Secret123")
+
+        self.assertTrue(verify_password("Secret123", stored))
+
+    def test_verify_wrong_password(self):
+        """Test that a different password does not verify."""
+        stored = hash_password("Secret123")
+
+        self.assertFalse(verify_password("Secret124", stored))
+
+    def test_verify_malformed_hash(self):
+        """Test that malformed hashes are rejected instead of raising."""
+        for stored in ["", "plaintext", "scrypt$1$2$3", "scrypt$x$8$1$AA==$AA=="]:
+            with self.subTest(stored=stored):
+                self.assertFalse(verify_password("Secret123", stored))
+
+    def test_verify_unknown_scheme(self):
+        """Test that hashes from another scheme are rejected."""
+        stored = hash_password("Secret123").replace("scrypt", "bcrypt", 1)
+
+        self.assertFalse(verify_password("Secret123", stored))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Test suite for the console table formatter.
+
+This module contains unit tests for presentation.table_formatter, covering:
+- Single-call table output through write_table
+- The binary stdout path and its text fallback
+"""
+
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from presentation.table_formatter import format_booking_table, write_table
+
+
+class TestWriteTable(unittest.TestCase):
+    """Test cases for write_table."""
+
+    def test_matches_print_output(self):
+        """Test that write_table emits exactly what print() would."""
+        table = format_booking_table([("T1", "Tennis Court", "x", "bob", "PAID")])
+        printed, written = io.StringIO(), io.StringIO()
+
+        print(table, file=printed)
+        write_table(table, written)
+
+        self.assertEqual(written.getvalue(), printed.getvalue())
+
+    def test_single_write_call(self):
+        """Test that the table and its newline go out in one write."""
+        stream = io.StringIO()
+
+        with patch.object(stream, "write") as mock_write:
+            write_table("Table", stream)
+
+        mock_write.assert_called_once_with("Table\n")
+
+    def test_stdout_buffer_receives_encoded_table(self):
+        """Test that stdout's binary buffer gets the table in one write."""
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", newline="\n")
+        stdout.write("before\n")
+
+        with patch("sys.stdout", stdout):
+            write_table("✅ PAID")
+
+        expected = f"before\n✅ PAID{os.linesep}".encode("utf-8")
+        self.assertEqual(stdout.buffer.getvalue(), expected)
+
+    def test_stdout_without_buffer_falls_back_to_text(self):
+        """Test that a stdout without a binary buffer gets a text write."""
+        stdout = io.StringIO()
+
+        with patch("sys.stdout", stdout):
+            write_table("Table")
+
+        self.assertEqual(stdout.getvalue(), "Table\n")
+
+
+if __name__ == "__main__":
+    unittest.main()